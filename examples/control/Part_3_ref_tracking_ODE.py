@@ -49,17 +49,13 @@ if __name__ == "__main__":
     n_samples = 2000    # number of sampled scenarios
 
     #  sampled references for training the policy
-    list_refs = [torch.rand(1, 1)*torch.ones(nsteps+1, nref) for k in range(n_samples)]
-    ref = torch.cat(list_refs)
-    batched_ref = ref.reshape([n_samples, nsteps+1, nref])
+    batched_ref = torch.rand(n_samples, 1, 1).expand(-1, nsteps+1, nref)
     # Training dataset
     train_data = DictDataset({'x': torch.rand(n_samples, 1, nx),
                               'r': batched_ref}, name='train')
 
     # references for dev set
-    list_refs = [torch.rand(1, 1)*torch.ones(nsteps+1, nref) for k in range(n_samples)]
-    ref = torch.cat(list_refs)
-    batched_ref = ref.reshape([n_samples, nsteps+1, nref])
+    batched_ref = torch.rand(n_samples, 1, 1).expand(-1, nsteps+1, nref)
     # Development dataset
     dev_data = DictDataset({'x': torch.rand(n_samples, 1, nx),
                             'r': batched_ref}, name='dev')
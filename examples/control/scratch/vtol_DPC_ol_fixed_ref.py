@@ -117,9 +117,9 @@ if __name__ == "__main__":
     l_system = lti(A, B, C, D)
     d_system = cont2discrete((A, B, C, D), dt=0.2, method='euler')
     A, B, C, D, dt = d_system
-    A = torch.tensor(A).float()
-    B = torch.tensor(B).float()
-    C = torch.tensor(C).float()
+    A = torch.from_numpy(A.astype(np.float32))
+    B = torch.from_numpy(B.astype(np.float32))
+    C = torch.from_numpy(C.astype(np.float32))
     # constraints bounds
     umin = -5.
     umax = 5.
@@ -132,11 +132,12 @@ if __name__ == "__main__":
     #  randomly sampled input output trajectories for training
     nsim = 10000   # number of datapoints
     sequences = {
-        "X": np.random.randn(nsim, nx),       # sampled initial conditions
-        "Y": 0.5*np.random.randn(nsim, ny),   # required for inference of nstep by dynamics class
-        "R": np.ones([nsim, 1]) * x_ref.T,    # sampled reference trajectory
+        "X": np.random.randn(nsim, nx).astype(np.float32),       # sampled initial conditions
+        "Y": 0.5*np.random.randn(nsim, ny).astype(np.float32),   # required for inference of nstep by dynamics class
+        "R": np.broadcast_to(x_ref.T.astype(np.float32), (nsim, nx)),    # constant reference, read-only view
     }
     nstep_data, loop_data, dims = get_sequence_dataloaders(sequences, args.nsteps)
+    del sequences  # datasets hold their own float32 copies
     train_data, dev_data, test_data = nstep_data
     train_loop, dev_loop, test_loop = loop_data
 
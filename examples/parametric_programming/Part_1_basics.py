@@ -19,7 +19,6 @@ import numpy as np
 import neuromancer.slim as slim
 import matplotlib.pyplot as plt
 import matplotlib.patheffects as patheffects
-from casadi import *
 import casadi
 import time
 
@@ -44,12 +43,10 @@ if __name__ == "__main__":
     nsim = 5000  # number of datapoints: increase sample density for more robust results
     # create dictionaries with sampled datapoints with uniform distribution
     a_low, a_high, p_low, p_high = 0.2, 1.2, 0.5, 2.0
-    samples_train = {"a": torch.FloatTensor(nsim, 1).uniform_(a_low, a_high),
-                     "p": torch.FloatTensor(nsim, 1).uniform_(p_low, p_high)}
-    samples_dev = {"a": torch.FloatTensor(nsim, 1).uniform_(a_low, a_high),
-                   "p": torch.FloatTensor(nsim, 1).uniform_(p_low, p_high)}
-    samples_test = {"a": torch.FloatTensor(nsim, 1).uniform_(a_low, a_high),
-                   "p": torch.FloatTensor(nsim, 1).uniform_(p_low, p_high)}
+    # draw (a, p) for all three splits at once, scaled in place from [0, 1) to [low, high)
+    samples = torch.rand(3, nsim, 2, generator=torch.Generator().manual_seed(data_seed))
+    samples.mul_(torch.tensor([a_high - a_low, p_high - p_low])).add_(torch.tensor([a_low, p_low]))
+    samples_train, samples_dev, samples_test = [{"a": s[:, 0:1], "p": s[:, 1:2]} for s in samples]
     # create named dictionary datasets
     train_data = DictDataset(samples_train, name='train')
     dev_data = DictDataset(samples_dev, name='dev')
@@ -108,9 +105,9 @@ if __name__ == "__main__":
     to visualize computational graph of the variable use x.show() method          
     """
 
-    # define decision variables
-    x = variable("x")[:, [0]]
-    y = variable("x")[:, [1]]
+    # define decision variables (basic slices are views of the solution map output)
+    x = variable("x")[:, 0:1]
+    y = variable("x")[:, 1:2]
     # problem parameters sampled in the dataset
     p = variable('p')
     a = variable('a')
@@ -194,6 +191,14 @@ if __name__ == "__main__":
         return opti, x, y
 
 
+    # plotting grid and the parameter-independent objective and constraint terms, evaluated once
+    x1 = np.arange(-0.5, 1.5, 0.02)
+    y1 = np.arange(-0.5, 1.5, 0.02)
+    xx, yy = np.meshgrid(x1, y1)
+    J_0, J_a = (1 - xx) ** 2, (yy - xx ** 2) ** 2
+    r2 = xx ** 2 + yy ** 2
+    c1 = xx - yy
+
     for s in range(0, 10):
         # selected parameters for a single instance problem
         p = 0.1 * s + 0.5
@@ -208,15 +213,10 @@ if __name__ == "__main__":
         """
         Plots
         """
-        x1 = np.arange(-0.5, 1.5, 0.02)
-        y1 = np.arange(-0.5, 1.5, 0.02)
-        xx, yy = np.meshgrid(x1, y1)
-
-        # eval objective and constraints
-        J = (1 - xx) ** 2 + a * (yy - xx ** 2) ** 2
-        c1 = xx - yy
-        c2 = xx ** 2 + yy ** 2 - (p / 2) ** 2
-        c3 = -(xx ** 2 + yy ** 2) + p ** 2
+        # eval objective and constraints for the selected parameters
+        J = J_0 + a * J_a
+        c2 = r2 - (p / 2) ** 2
+        c3 = p ** 2 - r2
 
         fig, ax = plt.subplots(1, 1)
         cp = ax.contourf(xx, yy, J,
@@ -243,9 +243,9 @@ if __name__ == "__main__":
         # Solution to pNLP via Neuromancer
         datapoint = {'a': torch.tensor([[a]]), 'p': torch.tensor([[p]]),
                      'name': 'test'}
-        model_out = problem(datapoint)
-        x_nm = model_out['test_' + "x"][0, 0].detach().numpy()
-        y_nm = model_out['test_' + "x"][0, 1].detach().numpy()
+        with torch.no_grad():
+            model_out = problem(datapoint)
+        x_nm, y_nm = model_out['test_' + "x"][0].detach().numpy()
         print(x_nm)
         print(y_nm)
 
@@ -281,11 +281,22 @@ if __name__ == "__main__":
     datapoint = {'a': a_samples, 'p': p_samples, 'name': 'test'}
 
     # Solve via neuromancer
-    t = time.time()
-    model_out = problem(datapoint)
-    nm_time = time.time() - t
-    x_nm = model_out['test_' + "x"][:, [0]].detach().numpy()
-    y_nm = model_out['test_' + "x"][:, [1]].detach().numpy()
+    with torch.no_grad():
+        t = time.time()
+        model_out = problem(datapoint)
+        nm_time = time.time() - t
+    xy_nm = model_out['test_' + "x"].numpy()
+    x_nm, y_nm = xy_nm[:, [0]], xy_nm[:, [1]]
+
+    # Solve via neuromancer with the solution map evaluated in bfloat16: the weights stay in float32
+    # and autocast casts a, p and the MLP matmuls at the map boundary on the model's device.
+    # Faster on Ampere+ GPUs and BF16-capable CPUs, at bfloat16 precision of the solution.
+    device_type = next(problem.parameters()).device.type
+    with torch.no_grad(), torch.autocast(device_type=device_type, dtype=torch.bfloat16):
+        t = time.time()
+        model_out_bf16 = problem(datapoint)
+        nm_bf16_time = time.time() - t
+    xy_nm_bf16 = model_out_bf16['test_' + "x"].float().numpy()
 
     # Solve via solver
     t = time.time()
@@ -304,7 +315,9 @@ if __name__ == "__main__":
     nm_con_viol_mean = eval_constraints(x_nm.ravel(), y_nm.ravel(), p_samples.numpy().ravel())
     print(f'Neuromancer mean constraints violation {nm_con_viol_mean:.4f}')
     nm_obj_mean = eval_objective(x_nm.ravel(), y_nm.ravel(), a_samples.numpy().ravel())
-    print(f'Neuromancer mean objective value {nm_obj_mean:.4f}\n')
+    print(f'Neuromancer mean objective value {nm_obj_mean:.4f}')
+    print(f'Solution for {n_samples} problems via Neuromancer in bfloat16 obtained in {nm_bf16_time:.4f} seconds, '
+          f'max deviation from float32 solution {np.abs(xy_nm_bf16 - xy_nm).max():.4f}\n')
 
     # Evaluate solver solution
     print(f'Solution for {n_samples} problems via solver obtained in {solver_time:.4f} seconds')
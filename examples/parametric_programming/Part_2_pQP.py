@@ -34,7 +34,7 @@ import matplotlib.patheffects as patheffects
 from neuromancer.trainer import Trainer
 from neuromancer.problem import Problem
 from neuromancer.constraint import variable
-from neuromancer.dataset import DictDataset
+from neuromancer.dataset import DictDataset, BatchSliceLoader
 from neuromancer.loss import PenaltyLoss
 from neuromancer.modules import blocks
 from neuromancer.system import Node
@@ -52,24 +52,19 @@ if __name__ == "__main__":
     nsim = 3000  # number of datapoints: increase sample density for more robust results
     # create dictionaries with sampled datapoints with uniform distribution
     p_low, p_high = 1.0, 11.0
-    samples_train = {"p1": torch.FloatTensor(nsim, 1).uniform_(p_low, p_high),
-                     "p2": torch.FloatTensor(nsim, 1).uniform_(p_low, p_high)}
-    samples_dev = {"p1": torch.FloatTensor(nsim, 1).uniform_(p_low, p_high),
-                   "p2": torch.FloatTensor(nsim, 1).uniform_(p_low, p_high)}
-    samples_test = {"p1": torch.FloatTensor(nsim, 1).uniform_(p_low, p_high),
-                   "p2": torch.FloatTensor(nsim, 1).uniform_(p_low, p_high)}
+    # draw p1, p2 for all three splits at once from a seeded generator
+    samples = torch.empty(3, 2, nsim, 1).uniform_(p_low, p_high,
+                                                  generator=torch.Generator().manual_seed(data_seed))
+    samples_train, samples_dev, samples_test = [{"p1": s[0], "p2": s[1]} for s in samples]
     # create named dictionary datasets
     train_data = DictDataset(samples_train, name='train')
     dev_data = DictDataset(samples_dev, name='dev')
     test_data = DictDataset(samples_test, name='test')
-    # create torch dataloaders for the Trainer
-    train_loader = torch.utils.data.DataLoader(train_data, batch_size=32, num_workers=0,
-                                               collate_fn=train_data.collate_fn, shuffle=True)
-    dev_loader = torch.utils.data.DataLoader(dev_data, batch_size=32, num_workers=0,
-                                             collate_fn=dev_data.collate_fn, shuffle=True)
-    test_loader = torch.utils.data.DataLoader(test_data, batch_size=32, num_workers=0,
-                                             collate_fn=test_data.collate_fn, shuffle=True)
-    # note: training quality will depend on the DataLoader parameters such as batch size and shuffle
+    # create dataloaders for the Trainer, slicing each batch straight from the sampled tensors
+    train_loader = BatchSliceLoader(train_data, batch_size=32, shuffle=True)
+    dev_loader = BatchSliceLoader(dev_data, batch_size=32, shuffle=True)
+    test_loader = BatchSliceLoader(test_data, batch_size=32, shuffle=True)
+    # note: training quality will depend on the dataloader parameters such as batch size and shuffle
 
     # visualize taining and test samples for 2D parametric space
     a_train = samples_train['p1'].numpy()
@@ -108,8 +103,8 @@ if __name__ == "__main__":
     # # #  mpQP objective and constraints formulation in Neuromancer
     """
     # variables
-    x = variable("x")[:, [0]]
-    y = variable("x")[:, [1]]
+    x = variable("x")[:, 0:1]
+    y = variable("x")[:, 1:2]
     # sampled parameters
     p1 = variable('p1')
     p2 = variable('p2')
@@ -121,21 +116,22 @@ if __name__ == "__main__":
 
     # constraints
     Q_con = 100.
-    g1 = -x - y + p1
-    con_1 = Q_con * (g1 <= 0)
-    con_1.name = 'c1'
     if problem_type == 'pQP':  # constraints for QP
-        g2 = x + y - p1 - 5
-        con_2 = Q_con*(g2 <= 0)
-        con_2.name = 'c2'
-        g3 = x - y + p2 - 5
-        con_3 = Q_con*(g3 <= 0)
-        con_3.name = 'c3'
-        g4 = -x + y - p2
-        con_4 = Q_con*(g4 <= 0)
-        con_4.name = 'c4'
-        constraints = [con_1, con_2, con_3, con_4]
+        # the four affine constraints g <= 0 stacked in matrix form, evaluated with one matmul:
+        #   g1 = -x - y + p1,  g2 = x + y - p1 - 5,  g3 = x - y + p2 - 5,  g4 = -x + y - p2
+        A = torch.tensor([[-1., -1.], [1., 1.], [1., -1.], [-1., 1.]])
+        e1 = torch.tensor([[1., -1., 0., 0.]])
+        e2 = torch.tensor([[0., 0., 1., -1.]])
+        c = torch.tensor([[0., -5., -5., 0.]])
+        g = variable("x") @ A.T + p1 * e1 + p2 * e2 + c
+        # the penalty is averaged over the 4 columns, so scale it to match 4 separate constraints
+        con = 4 * Q_con * (g <= 0)
+        con.name = 'c'
+        constraints = [con]
     elif problem_type == 'pQCQP':  # constraints for QCQP
+        g1 = -x - y + p1
+        con_1 = Q_con * (g1 <= 0)
+        con_1.name = 'c1'
         g2 = x**2+y**2 - p2**2
         con_2 = Q_con*(g2 <= 0)
         con_2.name = 'c2'
@@ -178,25 +174,30 @@ if __name__ == "__main__":
     """
     CVXPY benchmarks
     """
-    # Define the CVXPY problems.
+    # Define the parametric CVXPY problems, canonicalized on the first solve and reused afterwards.
 
-    def QP_param(p1, p2):
+    def QP_param():
         x = cp.Variable(1)
         y = cp.Variable(1)
+        p1 = cp.Parameter()
+        p2 = cp.Parameter()
         prob = cp.Problem(cp.Minimize(x ** 2 + y ** 2),
                           [-x - y + p1 <= 0,
                            x + y - p1 - 5 <= 0,
                            x - y + p2 - 5 <= 0,
                            -x + y - p2 <= 0])
-        return prob, x, y
+        return prob, x, y, p1, p2
 
-    def QCQP_param(p1, p2):
+    def QCQP_param():
         x = cp.Variable(1)
         y = cp.Variable(1)
+        p1 = cp.Parameter()
+        # holds p2**2, since squaring a parameter would break DPP
+        p2_sq = cp.Parameter(nonneg=True)
         prob = cp.Problem(cp.Minimize(x ** 2 + y ** 2),
                       [-x - y + p1 <= 0,
-                       x ** 2 + y ** 2 - p2 ** 2 <= 0])
-        return prob, x, y
+                       x ** 2 + y ** 2 - p2_sq <= 0])
+        return prob, x, y, p1, p2_sq
 
 
     """
@@ -204,9 +205,26 @@ if __name__ == "__main__":
     """
     # test problem parameters
     params = [2.0, 3.0, 4.0, 5.0, 6.0, 7.0, 8.0, 9.0, 10.0]
-    x1 = np.arange(-1.0, 10.0, 0.05)
-    y1 = np.arange(-1.0, 10.0, 0.05)
+    x1 = np.arange(-1.0, 10.0, 0.05, dtype=np.float32)
+    y1 = np.arange(-1.0, 10.0, 0.05, dtype=np.float32)
     xx, yy = np.meshgrid(x1, y1)
+    # objective and constraint fields over the grid; the constraints only shift with p
+    J = xx ** 2 + yy ** 2
+    S = xx + yy
+    D = xx - yy
+    # solve all test problems via neuromancer in a single batched forward pass
+    P = torch.tensor(params).unsqueeze(1)
+    with torch.inference_mode():
+        model_out = problem({'p1': P, 'p2': P, 'name': 'test'})
+    xy_nm = model_out['test_' + "x"].numpy()
+    f_nm = model_out['test_' + f.key]
+    if problem_type == 'pQP':
+        # columns of the stacked constraints g are g1..g4
+        g_nm = {f'g{j + 1}': model_out['test_' + g.key][:, j:j + 1] for j in range(4)}
+        prob, x, y, p1_cp, p2_cp = QP_param()
+    elif problem_type == 'pQCQP':
+        g_nm = {'g1': model_out['test_' + g1.key], 'g2': model_out['test_' + g2.key]}
+        prob, x, y, p1_cp, p2_cp = QCQP_param()
     fig, ax = plt.subplots(3, 3)
     row_id = 0
     column_id = 0
@@ -215,15 +233,14 @@ if __name__ == "__main__":
             row_id += 1
             column_id = 0
 
-        # eval and plot objective and constraints
-        J = xx ** 2 + yy ** 2
+        # plot objective and constraints
         cp_plot = ax[row_id, column_id].contourf(xx, yy, J, 50, alpha=0.4)
         ax[row_id, column_id].set_title(f'QP p={p}')
         if problem_type == 'pQP':  # constraints for QP
-            c1 = xx + yy - p
-            c2 = -xx - yy + p + 5
-            c3 = -xx + yy - p + 5
-            c4 = xx - yy + p
+            c1 = S - p
+            c2 = -S + p + 5
+            c3 = -D - p + 5
+            c4 = D + p
             cg1 = ax[row_id, column_id].contour(xx, yy, c1, [0], colors='mediumblue', alpha=0.7)
             cg2 = ax[row_id, column_id].contour(xx, yy, c2, [0], colors='mediumblue', alpha=0.7)
             cg3 = ax[row_id, column_id].contour(xx, yy, c3, [0], colors='mediumblue', alpha=0.7)
@@ -240,8 +257,8 @@ if __name__ == "__main__":
                          path_effects=[patheffects.withTickedStroke()], alpha=0.7)
 
         if problem_type == 'pQCQP':  # constraints for QCQP
-            c1 = xx + yy - p
-            c2 = - xx ** 2 - yy ** 2 + p ** 2
+            c1 = S - p
+            c2 = p ** 2 - J
             cg1 = ax[row_id, column_id].contour(xx, yy, c1, [0], colors='mediumblue', alpha=0.7)
             cg2 = ax[row_id, column_id].contour(xx, yy, c2, [0], colors='mediumblue', alpha=0.7)
             if hasattr(cg1, 'collections') and cg1.collections:
@@ -254,27 +271,20 @@ if __name__ == "__main__":
 
         # Solve CVXPY problem
         if problem_type == 'pQP':
-            prob, x, y = QP_param(p, p)
+            p1_cp.value, p2_cp.value = p, p
         elif problem_type == 'pQCQP':
-            prob, x, y = QCQP_param(p, p)
+            p1_cp.value, p2_cp.value = p, p ** 2
         prob.solve()
 
-        # Solve via neuromancer
-        datapoint = {'p1': torch.tensor([[p]]), 'p2': torch.tensor([[p]]),
-                     'name': 'test'}
-        model_out = problem(datapoint)
-        x_nm = model_out['test_' + "x"][0, 0].detach().numpy()
-        y_nm = model_out['test_' + "x"][0, 1].detach().numpy()
+        # neuromancer solution
+        x_nm, y_nm = xy_nm[i]
 
         print(f'primal solution {problem_type} x={x.value}, y={y.value}')
         print(f'parameter p={p, p}')
         print(f'primal solution Neuromancer x1={x_nm}, x2={y_nm}')
-        print(f' f: {model_out["test_" + f.key]}')
-        print(f' g1: {model_out["test_" + g1.key]}')
-        print(f' g2: {model_out["test_" + g2.key]}')
-        if problem_type == 'pQP':
-            print(f' g3: {model_out["test_" + g3.key]}')
-            print(f' g4: {model_out["test_" + g4.key]}')
+        print(f' f: {f_nm[i]}')
+        for name, value in g_nm.items():
+            print(f' {name}: {value[i]}')
 
         # Plot optimal solutions
         ax[row_id, column_id].plot(x.value, y.value, 'go', markersize=10)
@@ -305,23 +315,24 @@ if __name__ == "__main__":
         return obj_value_mean
 
     # Solve via neuromancer
-    t = time.time()
-    samples_test['name'] = 'test'
-    model_out = problem(samples_test)
-    nm_time = time.time() - t
-    x_nm = model_out['test_' + "x"][:, [0]].detach().numpy()
-    y_nm = model_out['test_' + "x"][:, [1]].detach().numpy()
+    with torch.inference_mode():
+        t = time.time()
+        samples_test['name'] = 'test'
+        model_out = problem(samples_test)
+        nm_time = time.time() - t
+    xy_nm = model_out['test_' + "x"].detach().numpy()
+    x_nm, y_nm = xy_nm[:, [0]], xy_nm[:, [1]]
 
     # Solve via solver
     t = time.time()
+    prob, x, y, p1_cp, p2_cp = QP_param()
     x_solver, y_solver = [], []
     P1, P2 = [], []
     for i in range(0, nsim):
         p1 = samples_test['p1'][i].detach().numpy()
         p2 = samples_test['p2'][i].detach().numpy()
-        prob, x, y = QP_param(p1, p2)
+        p1_cp.value, p2_cp.value = p1.item(), p2.item()
         prob.solve(solver='OSQP', verbose=False)
-        prob.solve()
         x_solver.append(x.value)
         y_solver.append(y.value)
         P1.append(p1)
@@ -31,13 +31,13 @@ import torch.nn as nn
 import neuromancer.slim as slim
 import matplotlib.pyplot as plt
 import matplotlib.patheffects as patheffects
-from casadi import *
+import numpy as np
 import casadi
 
 from neuromancer.trainer import Trainer
 from neuromancer.problem import Problem
 from neuromancer.constraint import variable
-from neuromancer.dataset import DictDataset
+from neuromancer.dataset import DictDataset, BatchSliceLoader
 from neuromancer.loss import PenaltyLoss, BarrierLoss, AugmentedLagrangeLoss
 from neuromancer.modules import blocks
 from neuromancer.system import Node
@@ -92,6 +92,10 @@ def arg_pNLP_problem(prefix=''):
            help="mu_max in augmented lagrangian.")
     gp.add("-inner_loop", type=int, default=1,
            help="inner loop in augmented lagrangian")
+    gp.add("-optimizer_state_in", type=str, default=None,
+           help="Optimizer state saved by a previous run to warm-start AdamW moments from.")
+    gp.add("-optimizer_state_out", type=str, default=None,
+           help="Path to save the optimizer state to after training.")
     return parser
 
 
@@ -112,21 +116,19 @@ if __name__ == "__main__":
     nsim = 5000  # number of datapoints: increase sample density for more robust results
     # create dictionaries with sampled datapoints with uniform distribution
     p_low, p_high = 0.5, 6.0
-    samples_train = {"p": torch.FloatTensor(nsim, 1).uniform_(p_low, p_high)}
-    samples_dev = {"p": torch.FloatTensor(nsim, 1).uniform_(p_low, p_high)}
-    samples_test = {"p": torch.FloatTensor(nsim, 1).uniform_(p_low, p_high)}
+    # draw p for all three splits at once, scaled in place from [0, 1) to [p_low, p_high)
+    samples = torch.rand(3, nsim, 1, generator=torch.Generator().manual_seed(args.data_seed))
+    samples.mul_(p_high - p_low).add_(p_low)
+    samples_train, samples_dev, samples_test = [{"p": s} for s in samples]
     # create named dictionary datasets
     train_data = DictDataset(samples_train, name='train')
     dev_data = DictDataset(samples_dev, name='dev')
     test_data = DictDataset(samples_test, name='test')
-    # create torch dataloaders for the Trainer
-    train_loader = torch.utils.data.DataLoader(train_data, batch_size=32, num_workers=0,
-                                               collate_fn=train_data.collate_fn, shuffle=True)
-    dev_loader = torch.utils.data.DataLoader(dev_data, batch_size=32, num_workers=0,
-                                             collate_fn=dev_data.collate_fn, shuffle=True)
-    test_loader = torch.utils.data.DataLoader(test_data, batch_size=32, num_workers=0,
-                                             collate_fn=test_data.collate_fn, shuffle=True)
-    # note: training quality will depend on the DataLoader parameters such as batch size and shuffle
+    # create loaders for the Trainer: each batch is sliced from the sample tensors in one indexing op
+    train_loader = BatchSliceLoader(train_data, batch_size=32, shuffle=True)
+    dev_loader = BatchSliceLoader(dev_data, batch_size=32, shuffle=True)
+    test_loader = BatchSliceLoader(test_data, batch_size=32, shuffle=True)
+    # note: training quality will depend on the loader parameters such as batch size and shuffle
 
     """
     # # #  pNLP primal solution map architecture
@@ -143,8 +145,11 @@ if __name__ == "__main__":
     # # #  pNLP objective and constraints formulation in Neuromancer
     """
     # variables
-    x = variable("x")[:, [0]]
-    y = variable("x")[:, [1]]
+    xy = variable("x")
+    x = xy[:, 0:1]
+    y = xy[:, 1:2]
+    # x**2 + y**2, shared by both ring constraints, from one elementwise op over the (B, 2) solution
+    r2 = torch.sum(xy**2, dim=1, keepdim=True)
     # sampled parameters
     p = variable('p')
 
@@ -152,7 +157,7 @@ if __name__ == "__main__":
     obj_opt = {'Rosenbrock': (1 - x)**2 + (y - x**2)**2,
                'GomezLevy': 4 * x ** 2 - 2.1 * x ** 4 + 1 / 3 * x ** 6 + x * y - 4 * y ** 2 + 4 * y ** 4,
                'Himelblau': (x**2 + y - 11)**2 + (x + y**2 - 7)**2,
-               'Styblinski-Tang': x**4 -15*x**2 + 5*x + y**4 -15*y**2 + 5*y,
+               'Styblinski-Tang': torch.sum(xy**4 - 15*xy**2 + 5*xy, dim=1, keepdim=True),
                'Simionescu': 0.1*x*y,
                'McCormick': torch.sin(x + y) + (x - y)**2 - 1.5*x + 2.5*y +1,
                'Three-hump-camel': 2*x**2 - 1.05*x**4 + (x**6)/6 + x*y + y**2,
@@ -163,8 +168,8 @@ if __name__ == "__main__":
 
     # define constraints
     con_1 = args.Q_con*(x >= y)
-    con_2 = args.Q_con*((p/2)**2 <= x**2+y**2)
-    con_3 = args.Q_con*(x**2+y**2 <= p**2)
+    con_2 = args.Q_con*((p/2)**2 <= r2)
+    con_3 = args.Q_con*(r2 <= p**2)
     con_1.name = 'c1'
     con_2.name = 'c2'
     con_3.name = 'c3'
@@ -184,14 +189,23 @@ if __name__ == "__main__":
                           'mu_init': args.mu_init, "mu_max": args.mu_max}
         loss = AugmentedLagrangeLoss(objectives, constraints, train_data, **optimizer_args)
 
-    # construct constrained optimization problem
-    # construct constrained optimization problem
-    problem = Problem(components, loss)
+    # construct constrained optimization problem and place it on the training device
+    problem = Problem(components, loss).to(device)
 
     """
     # # #  pNLP problem solution in Neuromancer
     """
-    optimizer = torch.optim.AdamW(problem.parameters(), lr=args.lr)
+    optimizer = torch.optim.AdamW(problem.parameters(), lr=args.lr, fused=True if device != 'cpu' else None)
+    if args.optimizer_state_in is not None:
+        # warm-start AdamW moments from a previous run with the same solution map architecture
+        state = torch.load(args.optimizer_state_in, map_location=device)
+        shapes = [p.shape for p in problem.parameters()]
+        saved = [s['exp_avg'].shape for _, s in sorted(state['state'].items())]
+        if saved == shapes:
+            optimizer.load_state_dict(state)
+            optimizer.param_groups[0]['lr'] = args.lr
+        else:
+            print(f'Ignoring {args.optimizer_state_in}: parameter shapes do not match')
     # define trainer
     trainer = Trainer(
         problem,
@@ -206,11 +220,14 @@ if __name__ == "__main__":
         dev_metric="dev_loss",
         test_metric="test_loss",
         eval_metric="dev_loss",
+        device=device,
     )
 
     # Train mpLP solution map
     best_model = trainer.train()
     best_outputs = trainer.test(best_model)
+    if args.optimizer_state_out is not None:
+        torch.save(optimizer.state_dict(), args.optimizer_state_out)
     # load best model dict
     problem.load_state_dict(best_model)
 
@@ -252,10 +269,10 @@ if __name__ == "__main__":
     print(sol.value(y))
 
     # solve NLP instance via Neuromancer
-    datapoint = {'p': torch.tensor([[p]]), 'name': 'test'}
-    model_out = problem(datapoint)
-    x_nm = model_out['test_' + "x"][0, 0].detach().numpy()
-    y_nm = model_out['test_' + "x"][0, 1].detach().numpy()
+    datapoint = {'p': torch.tensor([[p]], device=device), 'name': 'test'}
+    with torch.no_grad():
+        model_out = problem(datapoint)
+    x_nm, y_nm = model_out['test_' + "x"][0].cpu().numpy()
     print('Neuromancer solution:')
     print(x_nm)
     print(y_nm)
@@ -265,35 +282,37 @@ if __name__ == "__main__":
     """
     x1 = np.arange(-5., 5., 0.02)
     y1 = np.arange(-5., 5., 0.02)
-    xx, yy = np.meshgrid(x1, y1)
-    # eval and plot objective
-    obj_opt_plot = {'Rosenbrock': (1 - xx) ** 2 + (yy - xx ** 2) ** 2,
-                   'GomezLevy': 4 * xx ** 2 - 2.1 * xx ** 4 + 1 / 3 * xx ** 6 + xx * yy - 4 * yy ** 2 + 4 * yy ** 4,
-                   'Himelblau': (xx ** 2 + yy - 11) ** 2 + (xx + yy ** 2 - 7) ** 2,
-                   'Styblinski-Tang': xx ** 4 - 15 * xx ** 2 + 5 * xx + yy ** 4 - 15 * yy ** 2 + 5 * yy,
-                   'Simionescu': 0.1 * xx * yy,
-                   'McCormick': np.sin(xx + yy) + (xx - yy) ** 2 - 1.5 * xx + 2.5 * yy + 1,
-                   'Three-hump-camel': 2 * xx ** 2 - 1.05 * xx ** 4 + (xx ** 6) / 6 + xx * yy + yy ** 2,
-                   'Beale': (1.5 - xx + xx * yy) ** 2 + (2.25 - xx + xx * yy ** 2) ** 2 + (2.625 - xx + xx * yy ** 3) ** 2}
-    J = obj_opt_plot[args.obj_fun]
+    # row and column vectors broadcast to the full grid only in the evaluated expressions
+    xx, yy = x1[None, :], y1[:, None]
+    # eval and plot objective: only the selected objective is evaluated on the grid
+    obj_opt_plot = {'Rosenbrock': lambda xx, yy: (1 - xx) ** 2 + (yy - xx ** 2) ** 2,
+                   'GomezLevy': lambda xx, yy: 4 * xx ** 2 - 2.1 * xx ** 4 + 1 / 3 * xx ** 6 + xx * yy - 4 * yy ** 2 + 4 * yy ** 4,
+                   'Himelblau': lambda xx, yy: (xx ** 2 + yy - 11) ** 2 + (xx + yy ** 2 - 7) ** 2,
+                   'Styblinski-Tang': lambda xx, yy: xx ** 4 - 15 * xx ** 2 + 5 * xx + yy ** 4 - 15 * yy ** 2 + 5 * yy,
+                   'Simionescu': lambda xx, yy: 0.1 * xx * yy,
+                   'McCormick': lambda xx, yy: np.sin(xx + yy) + (xx - yy) ** 2 - 1.5 * xx + 2.5 * yy + 1,
+                   'Three-hump-camel': lambda xx, yy: 2 * xx ** 2 - 1.05 * xx ** 4 + (xx ** 6) / 6 + xx * yy + yy ** 2,
+                   'Beale': lambda xx, yy: (1.5 - xx + xx * yy) ** 2 + (2.25 - xx + xx * yy ** 2) ** 2 + (2.625 - xx + xx * yy ** 3) ** 2}
+    J = obj_opt_plot[args.obj_fun](xx, yy)
     fig, ax = plt.subplots(1, 1)
-    cp = ax.contourf(xx, yy, J, levels=1000, alpha=0.6)
+    cp = ax.contourf(x1, y1, J, levels=1000, alpha=0.6)
     fig.colorbar(cp)
     ax.set_title(args.obj_fun+' pNLP')
     # eval  and plot  constraints
+    r2 = xx ** 2 + yy ** 2
     c1 = xx - yy
-    c2 = xx ** 2 + yy ** 2 - (p / 2) ** 2
-    c3 = -(xx ** 2 + yy ** 2) + p ** 2
+    c2 = r2 - (p / 2) ** 2
+    c3 = p ** 2 - r2
 
-    cg1 = ax.contour(xx, yy, c1, [0], colors='mediumblue', alpha=0.7)
+    cg1 = ax.contour(x1, y1, c1, [0], colors='mediumblue', alpha=0.7)
     if hasattr(cg1, 'collections') and cg1.collections:
         plt.setp(cg1.collections,
                  path_effects=[patheffects.withTickedStroke()], alpha=0.7)
-    cg2 = ax.contour(xx, yy, c2, [0], colors='mediumblue', alpha=0.7)
+    cg2 = ax.contour(x1, y1, c2, [0], colors='mediumblue', alpha=0.7)
     if hasattr(cg2, 'collections') and cg2.collections:
         plt.setp(cg2.collections,
                  path_effects=[patheffects.withTickedStroke()], alpha=0.7)
-    cg3 = ax.contour(xx, yy, c3, [0], colors='mediumblue', alpha=0.7)
+    cg3 = ax.contour(x1, y1, c3, [0], colors='mediumblue', alpha=0.7)
     if hasattr(cg3, 'collections') and cg3.collections:
         plt.setp(cg3.collections,
                  path_effects=[patheffects.withTickedStroke()], alpha=0.7)
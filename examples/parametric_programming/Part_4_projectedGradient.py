@@ -22,7 +22,7 @@ import torch.nn as nn
 import neuromancer.slim as slim
 import matplotlib.pyplot as plt
 import matplotlib.patheffects as patheffects
-from casadi import *
+import numpy as np
 import casadi
 
 from neuromancer.trainer import Trainer
@@ -111,8 +111,8 @@ if __name__ == "__main__":
     """
 
     # define primal decision variables
-    x = variable("x")[:, [0]]
-    y = variable("x")[:, [1]]
+    x = variable("x")[:, 0:1]
+    y = variable("x")[:, 1:2]
     # problem parameters sampled in the dataset
     p = variable('p')
     a = variable('a')
@@ -263,8 +263,7 @@ if __name__ == "__main__":
     datapoint = {'a': torch.tensor([[a]]), 'p': torch.tensor([[p]]),
                  'name': 'test'}
     model_out = problem(datapoint)
-    x_nm = model_out['test_' + "x"][0, 0].detach().numpy()
-    y_nm = model_out['test_' + "x"][0, 1].detach().numpy()
+    x_nm, y_nm = model_out['test_' + "x"][0].detach().numpy()
     print(x_nm)
     print(y_nm)
 
@@ -112,8 +112,8 @@ if __name__ == "__main__":
     """
     # define decision variables
     xy = variable("xy")
-    x = variable("xy")[:, [0]]
-    y = variable("xy")[:, [1]]
+    x = variable("xy")[:, 0:1]
+    y = variable("xy")[:, 1:2]
     # problem parameters sampled in the dataset
     p = variable('p')
     b_param = variable('b_param')
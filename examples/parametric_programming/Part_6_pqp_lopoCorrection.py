@@ -104,8 +104,8 @@ if __name__ == "__main__":
     # # #  mpQP objective and constraints formulation in Neuromancer
     """
     # variables
-    x = variable("x")[:, [0]]
-    y = variable("x")[:, [1]]
+    x = variable("x")[:, 0:1]
+    y = variable("x")[:, 1:2]
     # sampled parameters
     p1 = variable('p1')
     p2 = variable('p2')
@@ -319,9 +319,9 @@ if __name__ == "__main__":
         # Solve via neuromancer
         datapoint = {'p1': torch.tensor([[p]]), 'p2': torch.tensor([[p]]),
                         'name': 'test'}
-        model_out = problem(datapoint)
-        x_nm = model_out['test_' + "x"][0, 0].detach().numpy()
-        y_nm = model_out['test_' + "x"][0, 1].detach().numpy()
+        with torch.no_grad():
+            model_out = problem(datapoint)
+        x_nm, y_nm = model_out['test_' + "x"][0].detach().numpy()
         print(f'primal solution x={x.value}, y={y.value}')
         print(f'parameter p={p, p}')
         print(f'primal solution Neuromancer x1={x_nm}, x2={y_nm}')
@@ -358,10 +358,10 @@ if __name__ == "__main__":
         samples_test['name'] = 'test'
         model_out = problem(samples_test)
         nm_time = time.time() - t
-    x_nm = model_out['test_' + "x"][:, [0]].detach().numpy()
-    y_nm = model_out['test_' + "x"][:, [1]].detach().numpy()
-    x_nm_noDR = model_out['test_x_predicted'][:, [0]].detach().numpy()
-    y_nm_noDR = model_out['test_x_predicted'][:, [1]].detach().numpy()
+    xy_nm = model_out['test_' + "x"].detach().numpy()
+    x_nm, y_nm = xy_nm[:, [0]], xy_nm[:, [1]]
+    xy_nm_noDR = model_out['test_x_predicted'].detach().numpy()
+    x_nm_noDR, y_nm_noDR = xy_nm_noDR[:, [0]], xy_nm_noDR[:, [1]]
 
     # Solve via solver
     t = time.time()
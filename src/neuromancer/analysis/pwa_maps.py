@@ -103,9 +103,8 @@ def lpv_batched(fx, x, use_bias=True):
         lambda_h = nlin(Ax) / Ax  # activation scaling
         lambda_h[zeros] = 0.
 
-        lambda_h_mats = [torch.diag(v) for v in lambda_h]
-        activation_mats += lambda_h_mats
-        lambda_h_mats = torch.stack(lambda_h_mats)
+        lambda_h_mats = torch.diag_embed(lambda_h)
+        activation_mats += list(lambda_h_mats)
 
         x_layer = Ax * lambda_h
 
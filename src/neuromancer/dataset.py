@@ -1,3 +1,4 @@
+import itertools
 import math
 import os
 from typing import Dict, Optional
@@ -9,6 +10,9 @@ from scipy.io import loadmat
 import torch
 from torch.utils.data import Dataset, DataLoader
 from torch.utils.data.dataloader import default_collate
+
+from neuromancer.utils import _CSV_COLUMNS, _extract_vars, _split_experiments
+
 import sys 
 
 import lightning.pytorch as pl 
@@ -120,6 +124,87 @@ class DictDataset(Dataset):
         return batch
 
 
+class FullBatchLoader:
+    """
+    Iterable yielding a dataset's full batch, collated once up front. Drop-in replacement for a
+    DataLoader with batch_size=len(dataset) and shuffle=False.
+    """
+
+    def __init__(self, dataset, device=None, pin_memory=False):
+        """
+
+        :param dataset: (Dataset) dataset with a collate_fn method, e.g. SequenceDataset
+        :param device: (str or torch.device) optional device the batch is moved to once, so the
+            Trainer's per-epoch move is a no-op. Default None keeps the dataset's device.
+        :param pin_memory: (bool) pin CPU tensors of the batch, so the move to device (here or in
+            the Trainer) is asynchronous; tensors already off the CPU are left as they are. Like
+            DataLoader, pinning is skipped with a warning when CUDA is not available.
+        """
+        if pin_memory and not torch.cuda.is_available():
+            warnings.warn("pin_memory is set to True, but CUDA is not available; batches will not be pinned.")
+            pin_memory = False
+        self.dataset = dataset
+        self.device = device
+        self.pin_memory = pin_memory
+        self._source, self.batch = None, None
+
+    def _collate(self):
+        batch = self.dataset.collate_fn([self.dataset[i] for i in range(len(self.dataset))])
+        if self.pin_memory:
+            batch = {k: v.pin_memory() if isinstance(v, torch.Tensor) and v.device.type == "cpu" else v
+                     for k, v in batch.items()}
+        if self.device is not None:
+            batch = {k: v.to(self.device, non_blocking=self.pin_memory) if isinstance(v, torch.Tensor) else v
+                     for k, v in batch.items()}
+        return batch
+
+    def __iter__(self):
+        # re-collate only when the dataset's stacked tensor was replaced, e.g. by dataset.to(device)
+        source = getattr(self.dataset, "full_data", None)
+        if self.batch is None or source is not self._source:
+            self._source, self.batch = source, self._collate()
+        # shallow copy so per-epoch keys added by the Trainer do not leak into the cached batch
+        yield dict(self.batch)
+
+    def __len__(self):
+        return 1
+
+
+class BatchSliceLoader:
+    """
+    Iterable yielding minibatches of a dataset by indexing its tensors with one index vector per
+    batch, instead of fetching and collating samples one at a time as a DataLoader does. Suited to
+    tabular datasets of small samples, e.g. sampled problem parameters.
+    """
+
+    def __init__(self, dataset, batch_size=32, shuffle=False, generator=None):
+        """
+
+        :param dataset: (DictDataset or StaticDataset) dataset whose __getitem__ accepts a tensor of indices
+        :param batch_size: (int) number of samples per batch; the last batch may be smaller
+        :param shuffle: (bool) whether to draw a new sample permutation every epoch
+        :param generator: (torch.Generator) optional generator used for shuffling
+        """
+        self.dataset = dataset
+        self.batch_size = batch_size
+        self.shuffle = shuffle
+        self.generator = generator
+
+    def __iter__(self):
+        n = len(self.dataset)
+        if self.shuffle:
+            order = torch.randperm(n, generator=self.generator)
+        else:
+            order = torch.arange(n)
+        for idx in torch.split(order, self.batch_size):
+            batch = self.dataset[idx]
+            batch['name'] = self.dataset.name
+            yield batch
+
+    def __len__(self):
+        return -(-len(self.dataset) // self.batch_size)
+
+
 def _is_multisequence_data(data):
     return isinstance(data, list) and all([isinstance(x, dict) for x in data])
 
@@ -128,14 +213,8 @@ def _is_sequence_data(data):
     return isinstance(data, dict) and len({x.shape[0] for x in data.values()}) == 1
 
 
-def _extract_var(data, regex):
-    filtered = data.filter(regex=regex).values
-    return filtered if filtered.size != 0 else None
-
-
 SUPPORTED_EXTENSIONS = {".csv", ".mat"}
 
-
 def read_file(file_or_dir):
 
     if os.path.isdir(file_or_dir):
@@ -158,33 +237,24 @@ def _read_file(file_path):
 
     file_type = file_path.split(".")[-1].lower()
     if file_type == "mat":
-        f = loadmat(file_path)
+        f = loadmat(file_path, variable_names=["y", "x", "u", "d", "exp_id"])
         Y = f.get("y", None)  # outputs
         X = f.get("x", None)
         U = f.get("u", None)  # inputs
         D = f.get("d", None)  # disturbances
         id_ = f.get("exp_id", None)  # experiment run id
     elif file_type == "csv":
-        data = pd.read_csv(file_path)
-        Y = _extract_var(data, "^y[0-9]+$")
-        X = _extract_var(data, "^x[0-9]+$")
-        U = _extract_var(data, "^u[0-9]+$")
-        D = _extract_var(data, "^d[0-9]+$")
-        id_ = _extract_var(data, "^exp_id")
+        data = pd.read_csv(file_path, usecols=lambda c: _CSV_COLUMNS.search(c) is not None)
+        variables = _extract_vars(data)
+        Y, X, U, D, id_ = (variables.get(k) for k in ["Y", "X", "U", "D", "exp_id"])
     else:
         print(f"error: unsupported file type: {file_type}")
 
     assert any([v is not None for v in [Y, X, U, D]])
 
-    if id_ is None:
-        return {
-            k: v for k, v in zip(["Y", "X", "U", "D"], [Y, X, U, D]) if v is not None
-        }
-    else:
-        return [
-            {k: v[id_.flatten() == i, ...] for k, v in zip(["Y", "X", "U", "D"], [Y, X, U, D]) if v is not None}
-            for i in sorted(set(id_.flatten()))
-        ]
+    # cast once here to the float32 precision used by the datasets, halving memory for later steps
+    data = {k: v.astype(np.float32, copy=False) for k, v in zip(["Y", "X", "U", "D"], [Y, X, U, D]) if v is not None}
+    return data if id_ is None else _split_experiments(data, id_)
 
 
 def batch_tensor(x: torch.Tensor, steps: int, mh: bool = False):
@@ -195,24 +265,44 @@ def unbatch_tensor(x: torch.Tensor, mh: bool = False):
     return (
         torch.cat((x[:, :, :, 0], x[-1, :, :, 1:]), dim=0)
         if mh
-        else torch.cat(torch.unbind(x, 0), dim=-1)
+        else x.movedim(0, -2).flatten(-2)
     )
 
 
 def _get_sequence_time_slices(data):
-    seq_lens = []
-    for i, d in enumerate(data):
-        seq_lens.append(None)
-        for v in d.values():
-            seq_lens[i] = seq_lens[i] or v.shape[0]
-            assert seq_lens[i] == v.shape[0], \
-                "sequence lengths within a dictionary must be equal"
-    slices = []
+    seq_lens = [{v.shape[0] for v in d.values()} for d in data]
+    assert all(len(n) == 1 for n in seq_lens), \
+        "sequence lengths within a dictionary must be equal"
+    ends = list(itertools.accumulate(n.pop() for n in seq_lens))
+    return [slice(start, end, 1) for start, end in zip([0] + ends[:-1], ends)]
+
+
+def _stack_variables(data, variables):
+    """Copy a list of data dictionaries into one preallocated float tensor, with variables
+    concatenated along the feature axis and dictionaries along the time/sample axis.
+
+    :param data: (list[dict str: np.array]) data dictionaries with 2-d values. Tensors already on
+        a device (e.g. GPU) keep the stacked data on that device.
+    :param variables: (list str) keys to stack, in feature-axis order.
+    """
+    widths = [data[0][k].shape[1] for k in variables]
+    lengths = [d[variables[0]].shape[0] for d in data]
+    first = data[0][variables[0]]
+    device = first.device if isinstance(first, torch.Tensor) else None
+    full_data = torch.empty(sum(lengths), sum(widths), dtype=torch.float, device=device)
     i = 0
-    for seq_len in seq_lens:
-        slices.append(slice(i, i + seq_len, 1))
-        i += seq_len
-    return slices
+    for d, n in zip(data, lengths):
+        j = 0
+        for k, w in zip(variables, widths):
+            v = d[k]
+            if isinstance(v, np.ndarray) and full_data.device.type == "cpu":
+                # numpy-side copy also accepts read-only views, e.g. constants from np.broadcast_to
+                full_data.numpy()[i:i + n, j:j + w] = v
+            else:
+                full_data[i:i + n, j:j + w] = torch.as_tensor(v)
+            j += w
+        i += n
+    return full_data
 
 
 def _validate_keys(data):
@@ -268,12 +358,10 @@ class SequenceDataset(Dataset):
             f"length of time series data must be greater than nsteps"
 
         self.nsteps = nsteps
+        self.moving_horizon = moving_horizon
 
         self.variables = list(keys)
-        self.full_data = torch.cat(
-            [torch.cat([torch.tensor(d[k], dtype=torch.float) for k in self.variables], dim=1) for d in data],
-            dim=0,
-        )
+        self.full_data = _stack_variables(data, self.variables)
         self.nsim = self.full_data.shape[0]
         self.dims = {k: (self.nsim, *data[0][k].shape[1:],) for k in self.variables}
 
@@ -292,11 +380,24 @@ class SequenceDataset(Dataset):
             "nsteps": nsteps,
         }
 
-        self.batched_data = torch.cat(
-            [batch_tensor(self.full_data[s, ...], nsteps, mh=moving_horizon) for s in self._sslices],
-            dim=0,
-        )
-        self.batched_data = self.batched_data.permute(0, 2, 1)
+        self.batched_data = self._batch_full_data()
+
+    def _batch_full_data(self):
+        # unfold gives a strided view of full_data; only multi-sequence data needs a concatenated copy
+        batched = [batch_tensor(self.full_data[s, ...], self.nsteps, mh=self.moving_horizon) for s in self._sslices]
+        batched = batched[0] if len(batched) == 1 else torch.cat(batched, dim=0)
+        return batched.permute(0, 2, 1)
+
+    def to(self, device, non_blocking=False):
+        """Move the dataset to device with a single transfer of full_data. Batches and full sequences
+        are re-derived on device as views of the moved tensor.
+
+        :param device: (str or torch.device) target device.
+        :param non_blocking: (bool) asynchronous copy when full_data is in pinned memory.
+        """
+        self.full_data = self.full_data.to(device, non_blocking=non_blocking)
+        self.batched_data = self._batch_full_data()
+        return self
 
     def __len__(self):
         """Gives the number of N-step batches in the dataset."""
@@ -305,18 +406,17 @@ class SequenceDataset(Dataset):
     def __getitem__(self, i):
         """Fetch a single N-step sequence from the dataset."""
         datapoint = {
-            **{
-                k + "p": self.batched_data[i, :, self._vslices[k]]
-                for k in self.variables
-            },
-            **{
-                k + "f": self.batched_data[i + 1, :, self._vslices[k]]
-                for k in self.variables
-            },
+            **self._split_variables(self.batched_data[i], "p"),
+            **self._split_variables(self.batched_data[i + 1], "f"),
         }
         datapoint['index'] = i
         return datapoint
 
+    def _split_variables(self, x, suffix):
+        """Split the stacked feature axis of x into per-variable views in a single pass."""
+        sizes = [sl.stop - sl.start for sl in self._vslices.values()]
+        return {k + suffix: v for k, v in zip(self._vslices, torch.split(x, sizes, dim=-1))}
+
     def _get_full_sequence_impl(self, start=0, end=None):
         """Returns the full sequence of data as a dictionary. Useful for open-loop evaluation.
         """
@@ -326,14 +426,8 @@ class SequenceDataset(Dataset):
             end = self.full_data.shape[0]
 
         return {
-            **{
-                k + "p": self.full_data[start:end - self.nsteps, self._vslices[k]].unsqueeze(0)
-                for k in self.variables
-            },
-            **{
-                k + "f": self.full_data[start + self.nsteps:end, self._vslices[k]].unsqueeze(0)
-                for k in self.variables
-            },
+            **self._split_variables(self.full_data[start:end - self.nsteps].unsqueeze(0), "p"),
+            **self._split_variables(self.full_data[start + self.nsteps:end].unsqueeze(0), "f"),
             "name": "loop_" + self.name,
         }
 
@@ -346,14 +440,8 @@ class SequenceDataset(Dataset):
 
     def get_full_batch(self):
         return {
-            **{
-                k + "p": self.batched_data[:-1, :, self._vslices[k]]
-                for k in self.variables
-            },
-            **{
-                k + "f": self.batched_data[1:, :, self._vslices[k]]
-                for k in self.variables
-            },
+            **self._split_variables(self.batched_data[:-1], "p"),
+            **self._split_variables(self.batched_data[1:], "f"),
             "name": "nstep_" + self.name,
         }
 
@@ -405,7 +493,7 @@ class StaticDataset(Dataset):
         self.name = name
 
         self.variables = list(data.keys())
-        self.full_data = torch.cat([torch.tensor(data[k], dtype=torch.float) for k in self.variables], dim=1)
+        self.full_data = _stack_variables([data], self.variables)
 
         self.nsamples = self.full_data.shape[0]
         self.dims = {k: (self.nsamples, *data[k].shape[1:],) for k in self.variables}
@@ -523,12 +611,11 @@ class GraphDataset(Dataset):
         """
 
         def radius_graph(x, r, loop):
-            dist = torch.cdist(x, x)
-            links = [torch.argwhere(d < r) for d in dist]
-            edges = [(i, j) for i in range(len(links)) for j in links[i] if i != j or loop]
-            if len(edges) == 0:
-                return torch.zeros(2, 0, dtype=torch.long)
-            return torch.tensor(edges, dtype=torch.long).permute(1, 0)
+            adj = torch.cdist(x, x) < r
+            if not loop:
+                adj.fill_diagonal_(False)
+            # row-major argwhere yields edges sorted by (source, target) without a Python loop over pairs
+            return torch.argwhere(adj).permute(1, 0)
 
         data = self.node_attr.get(feature)
         assert data is not None, "Feature to build graphs not found in node_attr."
@@ -671,18 +758,19 @@ def normalize_data(data, norm_type, stats=None):
             stats[k + "_max"].reshape(1, -1),
         )
 
-    keys = data[0].keys()
+    keys = list(data[0].keys())
     slices = _get_sequence_time_slices(data)
-    data = {k: np.concatenate([v[k] for v in data], axis=0) for k in keys}
-
-    norm_data = [norm_fn(v, k) for k, v in data.items()]
+    # each variable is normalized in its own dtype; a single sequence is only viewed as an array
+    # (accepting tensors too) instead of being copied into a concatenated one
+    norm_data = [norm_fn(np.concatenate([d[k] for d in data], axis=0) if len(data) > 1 else np.asarray(data[0][k]), k)
+                 for k in keys]
     norm_data, stat0, stat1 = zip(*norm_data)
 
     stats = {
-        **{k + "_min": v for k, v in zip(data.keys(), stat0)},
-        **{k + "_max": v for k, v in zip(data.keys(), stat1)},
+        **{k + "_min": v for k, v in zip(keys, stat0)},
+        **{k + "_max": v for k, v in zip(keys, stat1)},
     }
-    data = [{k: v[sl, ...] for k, v in zip(data.keys(), norm_data)} for sl in slices]
+    data = [{k: v[sl, ...] for k, v in zip(keys, norm_data)} for sl in slices]
 
     return data if multisequence else data[0], stats
 
@@ -760,13 +848,28 @@ def split_static_data(data, split_ratio=None):
     return train_data, dev_data, test_data
 
 
-def standardize(M, mean=None, std=None):
-    mean = M.mean(axis=0).reshape(1, -1) if mean is None else mean
-    std = M.std(axis=0).reshape(1, -1) if std is None else std
+def _shift_scale(M, shift, scale):
+    """Compute (M - shift) / scale into a single new floating point array, leaving M untouched."""
+    dtype = np.result_type(M, shift, scale)
+    # match true division, which yields float64 for integer operands
+    dtype = dtype if np.issubdtype(dtype, np.inexact) else np.float64
+    M_norm = np.subtract(M, shift, dtype=dtype)
     with warnings.catch_warnings():
         warnings.simplefilter("ignore")
-        M_norm = (M - mean) / std
-    return np.nan_to_num(M_norm), mean.squeeze(0), std.squeeze(0)
+        np.divide(M_norm, scale, out=M_norm)
+    return M_norm
+
+
+def _finite(M):
+    """Replace non-finite entries (e.g. from constant columns) in place, skipping the rewrite for clean data."""
+    return M if np.isfinite(M).all() else np.nan_to_num(M, copy=False)
+
+
+def standardize(M, mean=None, std=None):
+    mean = M.mean(axis=0, keepdims=True) if mean is None else mean
+    std = M.std(axis=0, keepdims=True) if std is None else std
+    M_norm = _shift_scale(M, mean, std)
+    return _finite(M_norm), mean.squeeze(0), std.squeeze(0)
 
 
 def normalize_01(M, Mmin=None, Mmax=None):
@@ -776,12 +879,10 @@ def normalize_01(M, Mmin=None, Mmax=None):
     :param Mmax: (int) Optional maximum. If not provided is inferred from data.
     :return: (2-d np.array) Min-max normalized data
     """
-    Mmin = M.min(axis=0).reshape(1, -1) if Mmin is None else Mmin
-    Mmax = M.max(axis=0).reshape(1, -1) if Mmax is None else Mmax
-    with warnings.catch_warnings():
-        warnings.simplefilter("ignore")
-        M_norm = (M - Mmin) / (Mmax - Mmin)
-    return np.nan_to_num(M_norm), Mmin.squeeze(0), Mmax.squeeze(0)
+    Mmin = M.min(axis=0, keepdims=True) if Mmin is None else Mmin
+    Mmax = M.max(axis=0, keepdims=True) if Mmax is None else Mmax
+    M_norm = _shift_scale(M, Mmin, Mmax - Mmin)
+    return _finite(M_norm), Mmin.squeeze(0), Mmax.squeeze(0)
 
 
 def normalize_11(M, Mmin=None, Mmax=None):
@@ -791,12 +892,12 @@ def normalize_11(M, Mmin=None, Mmax=None):
     :param Mmax: (int) Optional maximum. If not provided is inferred from data.
     :return: (2-d np.array) Min-max normalized data
     """
-    Mmin = M.min(axis=0).reshape(1, -1) if Mmin is None else Mmin
-    Mmax = M.max(axis=0).reshape(1, -1) if Mmax is None else Mmax
-    with warnings.catch_warnings():
-        warnings.simplefilter("ignore")
-        M_norm = 2 * ((M - Mmin) / (Mmax - Mmin)) - 1
-    return np.nan_to_num(M_norm), Mmin.squeeze(0), Mmax.squeeze(0)
+    Mmin = M.min(axis=0, keepdims=True) if Mmin is None else Mmin
+    Mmax = M.max(axis=0, keepdims=True) if Mmax is None else Mmax
+    M_norm = _shift_scale(M, Mmin, Mmax - Mmin)
+    M_norm *= 2
+    M_norm -= 1
+    return _finite(M_norm), Mmin.squeeze(0), Mmax.squeeze(0)
 
 
 def denormalize_01(M, Mmin, Mmax):
@@ -840,7 +941,16 @@ denorm_fns = {
 }
 
 
-def get_static_dataloaders(data, norm_type=None, split_ratio=None, num_workers=0, batch_size=32):
+def _default_pin_memory(pin_memory, dataset):
+    """Resolve pin_memory=None to pinning only when CUDA is available and the data is held on the CPU,
+    as pinning tensors already on the GPU raises."""
+    if pin_memory is None:
+        return torch.cuda.is_available() and dataset.full_data.device.type == "cpu"
+    return pin_memory
+
+
+def get_static_dataloaders(data, norm_type=None, split_ratio=None, num_workers=0, batch_size=32,
+                           pin_memory=None, slice_batches=False):
     """This will generate dataloaders for a given dictionary of data.
     Dataloaders are hard-coded for full-batch training to match NeuroMANCER's training setup.
 
@@ -850,6 +960,11 @@ def get_static_dataloaders(data, norm_type=None, split_ratio=None, num_workers=0
     :param norm_type: (str) type of normalization; see function `normalize_data` for more info.
     :param split_ratio: (list float) percentage of data in train and development splits; see
         function `split_sequence_data` for more info.get_static_dataloaders
+    :param pin_memory: (bool) whether the DataLoaders copy batches into pinned memory; only valid for
+        data held on the CPU. Default None pins when CUDA is available and the data is on the CPU.
+    :param slice_batches: (bool) return BatchSliceLoaders that slice batches straight from the stacked
+        data instead of DataLoaders collating per sample; these run in the main process and ignore
+        num_workers and pin_memory. (default: False)
     """
 
     if norm_type is not None:
@@ -868,35 +983,47 @@ def get_static_dataloaders(data, norm_type=None, split_ratio=None, num_workers=0
         test_data,
         name="test",
     )
+    pin_memory = _default_pin_memory(pin_memory, train_data)
 
-    train_data = DataLoader(
-        train_data,
-        batch_size=batch_size,
-        shuffle=True,
-        collate_fn=train_data.collate_fn,
-        num_workers=num_workers,
-    )
-    dev_data = DataLoader(
-        dev_data,
-        batch_size=batch_size,
-        shuffle=False,
-        collate_fn=dev_data.collate_fn,
-        num_workers=num_workers,
-    )
-    test_data = DataLoader(
-        test_data,
-        batch_size=batch_size,
-        shuffle=False,
-        collate_fn=test_data.collate_fn,
-        num_workers=num_workers,
-    )
+    if slice_batches:
+        train_data = BatchSliceLoader(train_data, batch_size=batch_size, shuffle=True)
+        dev_data = BatchSliceLoader(dev_data, batch_size=batch_size, shuffle=False)
+        test_data = BatchSliceLoader(test_data, batch_size=batch_size, shuffle=False)
+    else:
+        train_data = DataLoader(
+            train_data,
+            batch_size=batch_size,
+            shuffle=True,
+            collate_fn=train_data.collate_fn,
+            num_workers=num_workers,
+            persistent_workers=num_workers > 0,
+            pin_memory=pin_memory,
+        )
+        dev_data = DataLoader(
+            dev_data,
+            batch_size=batch_size,
+            shuffle=False,
+            collate_fn=dev_data.collate_fn,
+            num_workers=num_workers,
+            persistent_workers=num_workers > 0,
+            pin_memory=pin_memory,
+        )
+        test_data = DataLoader(
+            test_data,
+            batch_size=batch_size,
+            shuffle=False,
+            collate_fn=test_data.collate_fn,
+            num_workers=num_workers,
+            persistent_workers=num_workers > 0,
+            pin_memory=pin_memory,
+        )
 
     return (train_data, dev_data, test_data), train_data.dataset.dims
 
 
 def get_sequence_dataloaders(
     data, nsteps, moving_horizon=False, norm_type=None, split_ratio=None,
-        num_workers=0, batch_size=None):
+        num_workers=0, batch_size=None, pin_memory=None, device=None):
     """
     This function will generate dataloaders and open-loop sequence dictionaries for a given dictionary of
     data. Dataloaders are hard-coded for full-batch training to match NeuroMANCER's original
@@ -911,9 +1038,16 @@ def get_sequence_dataloaders(
     :param split_ratio: (list float) percentage of data in train and development splits; see
             function `split_sequence_data` for more info.
     :param num_workers: (int, optional) how many subprocesses to use for data loading.
-            0 means that the data will be loaded in the main process. (default: 0)
+            0 means that the data will be loaded in the main process; otherwise workers are kept
+            alive across epochs. (default: 0)
     :param batch_size: (int, optional) how many samples per batch to load
             (default: full-batch via len(data)).
+    :param pin_memory: (bool, optional) whether batches are copied into pinned memory; for DataLoaders
+            only valid for data held on the CPU. (default: None, pins when CUDA is available and the
+            data is on the CPU)
+    :param device: (str or torch.device, optional) device the full-batch loaders (batch_size=None,
+            num_workers=0) move each split to once; batches of DataLoaders are moved per step by the
+            Trainer instead. (default: None)
     """
     if norm_type is not None:
         data, _ = normalize_data(data, norm_type)
@@ -948,28 +1082,41 @@ def get_sequence_dataloaders(
     train_loop = train_data.get_full_sequence()
     dev_loop = dev_data.get_full_sequence()
     test_loop = test_data.get_full_sequence()
+    pin_memory = _default_pin_memory(pin_memory, train_data)
 
     # instantiate Pytorch dataloaders
-    train_data = DataLoader(
-        train_data,
-        batch_size=batch_size if batch_size is not None else len(train_data),
-        shuffle=False,
-        collate_fn=train_data.collate_fn,
-        num_workers=num_workers,
-    )
-    dev_data = DataLoader(
-        dev_data,
-        batch_size=batch_size if batch_size is not None else len(dev_data),
-        shuffle=False,
-        collate_fn=dev_data.collate_fn,
-        num_workers=num_workers,
-    )
-    test_data = DataLoader(
-        test_data,
-        batch_size=batch_size if batch_size is not None else len(test_data),
-        shuffle=False,
-        collate_fn=test_data.collate_fn,
-        num_workers=num_workers,
-    )
+    #   full-batch training without workers collates each split once instead of every epoch
+    if batch_size is None and num_workers == 0:
+        train_data = FullBatchLoader(train_data, device=device, pin_memory=pin_memory)
+        dev_data = FullBatchLoader(dev_data, device=device, pin_memory=pin_memory)
+        test_data = FullBatchLoader(test_data, device=device, pin_memory=pin_memory)
+    else:
+        train_data = DataLoader(
+            train_data,
+            batch_size=batch_size if batch_size is not None else len(train_data),
+            shuffle=False,
+            collate_fn=train_data.collate_fn,
+            num_workers=num_workers,
+            persistent_workers=num_workers > 0,
+            pin_memory=pin_memory,
+        )
+        dev_data = DataLoader(
+            dev_data,
+            batch_size=batch_size if batch_size is not None else len(dev_data),
+            shuffle=False,
+            collate_fn=dev_data.collate_fn,
+            num_workers=num_workers,
+            persistent_workers=num_workers > 0,
+            pin_memory=pin_memory,
+        )
+        test_data = DataLoader(
+            test_data,
+            batch_size=batch_size if batch_size is not None else len(test_data),
+            shuffle=False,
+            collate_fn=test_data.collate_fn,
+            num_workers=num_workers,
+            persistent_workers=num_workers > 0,
+            pin_memory=pin_memory,
+        )
 
     return (train_data, dev_data, test_data), (train_loop, dev_loop, test_loop), train_data.dataset.dims
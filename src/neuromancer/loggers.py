@@ -10,10 +10,14 @@ import numbers
 import numpy as np
 
 
+# metrics printed to stdout by default
+_STDOUT_METRICS = ('nstep_dev_loss', 'loop_dev_loss', 'best_loop_dev_loss',
+                   'nstep_dev_ref_loss', 'loop_dev_ref_loss')
+
+
 class BasicLogger:
     def __init__(self, args=None, savedir='test', verbosity=10,
-                 stdout=('nstep_dev_loss', 'loop_dev_loss', 'best_loop_dev_loss',
-                         'nstep_dev_ref_loss', 'loop_dev_ref_loss')):
+                 stdout=_STDOUT_METRICS):
         """
         :param args: (Namespace) returned by argparse.ArgumentParser.parse_args()
         :param savedir: (str) Folder to write results to.
@@ -24,7 +28,7 @@ class BasicLogger:
         self.stdout = stdout
         self.savedir = savedir
         self.verbosity = verbosity
-        self.start_time = time.time()
+        self.start_time = time.perf_counter()
         self.step = 0
         self.args = args
         self.log_parameters()
@@ -59,7 +63,7 @@ class BasicLogger:
         else:
             self.step = step
         if step % self.verbosity == 0:
-            elapsed_time = time.time() - self.start_time
+            elapsed_time = time.perf_counter() - self.start_time
             entries = [f'epoch: {step}']
             for k, v in output.items():
                 try:
@@ -85,8 +89,7 @@ class BasicLogger:
 
 class LossLogger(BasicLogger):
     def __init__(self, args=None, savedir='test', verbosity=10,
-                 stdout=('nstep_dev_loss', 'loop_dev_loss', 'best_loop_dev_loss',
-                         'nstep_dev_ref_loss', 'loop_dev_ref_loss')):
+                 stdout=_STDOUT_METRICS):
         super().__init__(args, savedir, verbosity, stdout)
         self.losses = {'train': [], 'dev': [], 'test': []}  # Initialize losses dictionary
 
@@ -102,7 +105,7 @@ class LossLogger(BasicLogger):
         else:
             self.step = step
         if step % self.verbosity == 0:
-            elapsed_time = time.time() - self.start_time 
+            elapsed_time = time.perf_counter() - self.start_time 
             entries = [f'epoch: {step}']
             for k, v in output.items():
                 try:
@@ -130,8 +133,7 @@ class LossLogger(BasicLogger):
 
 class MLFlowLogger(BasicLogger):
     def __init__(self, args=None, savedir='test', verbosity=1, id=None,
-                 stdout=('nstep_dev_loss','loop_dev_loss','best_loop_dev_loss',
-                         'nstep_dev_ref_loss','loop_dev_ref_loss'),
+                 stdout=_STDOUT_METRICS,
                  logout=None):
         # Lazy import so module import works even if mlflow isn't installed
         try:
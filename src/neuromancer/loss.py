@@ -68,7 +68,7 @@ class AggregateLoss(nn.Module, ABC):
             output = objective(input_dict)
             if isinstance(output, torch.Tensor):
                 output = {objective.output_keys[0]: output}
-            output_dict = {**output_dict, **output}
+            output_dict.update(output)
             loss += output_dict[objective.output_keys[0]]
         output_dict['objective_loss'] = loss
         return output_dict
@@ -85,7 +85,7 @@ class AggregateLoss(nn.Module, ABC):
         for c in self.constraints:
             # get loss, values, and violations of constraint via its forward pass
             output = c(input_dict)
-            output_dict = {**output_dict, **output}
+            output_dict.update(output)
             loss += output[c.output_keys[0]]
             cvalue = output[c.output_keys[1]]
             cviolation = output[c.output_keys[2]]
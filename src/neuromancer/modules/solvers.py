@@ -1,7 +1,7 @@
 
 import torch
 import torch.nn as nn
-from neuromancer.gradients import gradient, jacobian
+from neuromancer.gradients import jacobian
 from abc import ABC, abstractmethod
 from functorch import jacrev, jacfwd
 
@@ -112,10 +112,11 @@ class GradientProjection(Solver):
         for k in range(self.num_steps):
             # update energy
             energy = self.con_viol_energy(data)
-            for in_key, out_key in zip(self.input_keys, self.output_keys):
-                # get grad
-                x = data[in_key]
-                step = gradient(energy, x)
+            # gradients w.r.t. all input variables from a single backward pass
+            xs = [data[in_key] for in_key in self.input_keys]
+            steps = torch.autograd.grad(energy, xs, grad_outputs=torch.ones_like(energy),
+                                        create_graph=True)
+            for in_key, out_key, x, step in zip(self.input_keys, self.output_keys, xs, steps):
                 assert step.shape == x.shape, \
                     f'Dimensions of gradient step {step.shape} should be equal to dimensions ' \
                     f'{x.shape}  of a single variable {in_key}'
@@ -6,8 +6,6 @@ from itertools import combinations
 from scipy import stats
 import matplotlib.animation as animation
 from matplotlib.lines import Line2D
-import pyts.image as pytsimg
-import pyts.multivariate.image as pytsmvimg
 import torch
 from matplotlib import cm
 import matplotlib.image as mpimg
@@ -32,6 +30,7 @@ import matplotlib.patches as mpatches
 # local imports
 from neuromancer.dataset import unbatch_tensor
 from neuromancer.modules import blocks
+from neuromancer.analysis.pwa_maps import lpv_batched
 
 def _add_obj_components(graph, objs, components, data_keys, style="solid"):
     for obj in objs:
@@ -204,6 +203,10 @@ def pltRecurrence(X, figname=None):
     + https://arxiv.org/pdf/1610.07273.pdf
     + https://pyts.readthedocs.io/en/stable/auto_examples/image/plot_gaf.html#sphx-glr-auto-examples-image-plot-gaf-py
     """
+    # pyts compiles its numba kernels on import, so it is only loaded when this plot is requested
+    import pyts.image as pytsimg
+    import pyts.multivariate.image as pytsmvimg
+
     size = np.ceil(np.sqrt(X.shape[1])).astype(int)
     row_off = size-np.ceil(X.shape[1]/size).astype(int)
     # Recurrence plot
@@ -577,40 +580,31 @@ def plot_loss_DPC(model, policy, A, B, dataset, xmin=-5, xmax=5, save_path=None)
     name = dataset_plt['name']
     nsteps = dataset.dataset.nsteps
     Loss = np.ones([x.shape[0], y.shape[0]])*np.nan
-    # Alpha contraction coefficient: ||x_k+1|| = alpha * ||x_k||
-    Alpha = np.ones([x.shape[0], y.shape[0]])*np.nan
-    # ||A+B*Kx||
-    Phi_norm = np.ones([x.shape[0], y.shape[0]])*np.nan
     policy = policy.net
-    Anp = A.detach().numpy()
-    Bnp = B.detach().numpy()
-    for i in range(x.shape[0]):
-        for j in range(y.shape[0]):
-            # check loss
-            x_batch = torch.stack([x[[i]], y[[j]]]).repeat(dataset_plt['Yf'].shape[1], 1)
-            X = x_batch.reshape(1, -1, A.shape[0])
-            if nsteps == 1:
-                dataset_plt['Yp'] = X
+    # Alpha contraction coefficient: ||x_k+1|| = alpha * ||x_k||
+    # evaluated for all grid points with one batched policy call and dynamics step
+    points = torch.stack([xx, yy], dim=-1).reshape(-1, A.shape[0])
+    with torch.no_grad():
+        x_next = (points @ A.T).unsqueeze(-1) + B @ policy(points).unsqueeze(1)
+    norm_x = torch.linalg.vector_norm(points, dim=-1)
+    norm_next = torch.linalg.vector_norm(x_next, dim=(-2, -1))
+    Alpha = torch.where(norm_x == 0, 0., norm_next - norm_x).reshape(xx.shape).double().numpy()
+    # ||A+B*Kx|| with the local linear gains Kx of the policy at all grid points at once
+    with torch.no_grad():
+        Astar, _, _, _, _ = lpv_batched(policy, points)
+        phi = A + B @ Astar[:, :, 0].unsqueeze(1)
+    Phi_norm = torch.linalg.matrix_norm(phi).reshape(xx.shape).double().numpy()
+
+    if nsteps == 1:
+        for i in range(x.shape[0]):
+            for j in range(y.shape[0]):
+                # check loss
+                x_batch = torch.stack([x[[i]], y[[j]]]).repeat(dataset_plt['Yf'].shape[1], 1)
+                dataset_plt['Yp'] = x_batch.reshape(1, -1, A.shape[0])
                 dataset_plt['Yf'] = dataset_plt['Yf'][[0],:,:]
                 step = model(dataset_plt)
                 Loss[i,j] = step[name+'_loss'].detach().numpy()
-            # check contraction
-            x0 = X[:,0,:].view(1, X.shape[-1])
-            Astar, bstar, _, _, _ = lpv_batched(policy, x0)
-            BKx = torch.mm(B, Astar[:, :, 0])
-            phi = A + BKx
-            Phi_norm[i,j] = torch.norm(phi, 2).detach().numpy()
-            # print(torch.matmul(Astar[:, :, 0], x0.transpose(0, 1))+bstar)
-            u = policy(x0).detach().numpy()
-            xnp = x0.transpose(0, 1).detach().numpy()
-            xnp_n = np.matmul(Anp, xnp) + np.matmul(Bnp, u)
-            if not np.linalg.norm(xnp) == 0:
-                # Alpha[i,j] = np.linalg.norm(xnp_n)/np.linalg.norm(xnp)
-                Alpha[i,j] = np.linalg.norm(xnp_n) - np.linalg.norm(xnp)
-            else:
-                Alpha[i, j] = 0
 
-    if nsteps == 1:
         fig, ax = plt.subplots(subplot_kw={"projection": "3d"})
         surf = ax.plot_surface(xx.detach().numpy(), yy.detach().numpy(), Loss,
                                cmap=cm.viridis,
@@ -729,29 +723,31 @@ def plot_policy_train(A, B, policy, policy_list, xmin=-5, xmax=5, save_path=None
 
 def cl_simulate(A, B, net, nstep=50, x0=np.ones([2, 1])):
     """
-
-    :param A:
-    :param B:
-    :param net:
-    :param nstep:
-    :param x0:
-    :return:
+    Closed-loop simulation of the linear system x_k+1 = A x_k + B u_k under policy net.
+    Columns of x0 are independent initial conditions and are rolled out together as one batch.
+
+    :param A: (torch.Tensor, shape=[nx, nx]) state matrix
+    :param B: (torch.Tensor, shape=[nx, nu]) input matrix
+    :param net: (Callable) policy mapping states [N, nx] to control sequences [N, nu*nsteps]
+    :param nstep: (int) number of simulation steps
+    :param x0: (np.array, shape=[nx, N]) initial conditions
+    :return: states [nstep+2, nx] and inputs [nstep+1, nu] (trailing N axis if N > 1)
     """
-    Anp = A.detach().numpy()
-    Bnp = B.detach().numpy()
-    x = x0
-    X = [x]
-    U = []
-    for k in range(nstep+1):
-        x_torch = torch.tensor(x).float().transpose(0, 1)
-        # taking a first control action based on RHC principle
-        u = net(x_torch).detach().numpy()[:, [0]]
-        x = np.matmul(Anp, x) + np.matmul(Bnp, u)
-        X.append(x)
-        U.append(u)
-    Xnp = np.asarray(X)[:, :, 0]
-    Unp = np.asarray(U)[:, :, 0]
-    return Xnp, Unp
+    nx, nu = B.shape
+    ABt = torch.cat([A, B], dim=1).detach().T
+    x0 = torch.as_tensor(x0, dtype=ABt.dtype, device=ABt.device).T
+    # states and inputs are written in place side by side into one preallocated buffer,
+    # so each step is a single [x, u] @ [A, B]^T product
+    XU = torch.empty(nstep+2, x0.shape[0], nx + nu, dtype=ABt.dtype, device=ABt.device)
+    XU[0, :, :nx] = x0
+    with torch.no_grad():
+        for k in range(nstep+1):
+            # taking a first control action based on RHC principle
+            XU[k, :, nx:] = net(XU[k, :, :nx])[:, :nu]
+            XU[k+1, :, :nx] = XU[k] @ ABt
+    Xnp = XU[:, :, :nx].permute(0, 2, 1).cpu().numpy()
+    Unp = XU[:-1, :, nx:].permute(0, 2, 1).cpu().numpy()
+    return (Xnp[:, :, 0], Unp[:, :, 0]) if Xnp.shape[-1] == 1 else (Xnp, Unp)
 
 
 def plot_cl(X, U, nstep=50, save_path=None, trace_movie=False):
@@ -13,6 +13,8 @@ from inspect import signature
 import torch
 import torch.nn as nn
 
+# matplotlib backends that render to files only, where plt.show() displays nothing
+_NON_INTERACTIVE_BACKENDS = {'agg', 'cairo', 'pdf', 'pgf', 'ps', 'svg', 'template'}
 
 
 class LitProblem(pl.LightningModule):
@@ -136,7 +138,9 @@ class LitProblem(pl.LightningModule):
             self.custom_hooks['configure_optimizers'](self)
         else: 
             if self.custom_optimizer is None: 
-                optimizer = torch.optim.Adam(self.problem.parameters(), self.lr, betas=(0.0, 0.9))
+                # Lightning has placed the parameters by now; the fused kernel is used on CUDA
+                fused = True if all(p.is_cuda for p in self.problem.parameters()) else None
+                optimizer = torch.optim.Adam(self.problem.parameters(), self.lr, betas=(0.0, 0.9), fused=fused)
             else: 
                 optimizer = self.custom_optimizer
             return optimizer
@@ -199,14 +203,17 @@ class Problem(nn.Module):
         output_dict = self.loss(output_dict)
         if isinstance(output_dict, torch.Tensor):
             output_dict = {self.loss.name: output_dict}
-        return {f'{data["name"]}_{k}': v for k, v in output_dict.items()}
+        prefix = data["name"] + '_'
+        return {prefix + k: v for k, v in output_dict.items()}
 
     def step(self, input_dict: Dict[str, torch.Tensor]) -> Dict[str, torch.Tensor]:
+        # copy once so node outputs accumulate in place without mutating the caller's batch
+        input_dict = dict(input_dict)
         for node in self.nodes:
             output_dict = node(input_dict)
             if isinstance(output_dict, torch.Tensor):
                 output_dict = {node.name: output_dict}
-            input_dict = {**input_dict, **output_dict}
+            input_dict.update(output_dict)
         return input_dict
 
     def graph(self, include_objectives=True):
@@ -310,6 +317,9 @@ class Problem(nn.Module):
         return graph
 
     def show(self, figname=None):
+        if figname is None and plt.get_backend().lower() in _NON_INTERACTIVE_BACKENDS:
+            # nothing would be displayed, so skip rendering the graph through graphviz
+            return
         graph = self.graph()
         if figname is not None:
             plot_func = {'svg': graph.write_svg,
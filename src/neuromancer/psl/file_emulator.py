@@ -14,16 +14,11 @@ import numpy as np
 import pandas as pd
 from scipy.io import loadmat
 from neuromancer.psl.base import EmulatorBase, download
-
-
-def _extract_var(data, regex):
-    filtered = data.filter(regex=regex).values
-    return filtered if filtered.size != 0 else None
+from neuromancer.utils import _CSV_COLUMNS, _extract_vars, _split_experiments
 
 
 SUPPORTED_EXTENSIONS = {".csv", ".mat"}
 
-
 datasets = {"vehicle3": "NLIN_MIMO_vehicle/NLIN_MIMO_vehicle3.mat",
              "aero": "NLIN_MIMO_Aerodynamic/NLIN_MIMO_Aerodynamic.mat",
              "flexy_air": "Flexy_air/flexy_air_data.csv",
@@ -50,7 +45,7 @@ def _read_file(file_path):
     """
     file_type = file_path.split(".")[-1].lower()
     if file_type == "mat":
-        f = loadmat(file_path)
+        f = loadmat(file_path, variable_names=["y", "x", "u", "d", "exp_id", "Time"])
         Y = f.get("y", None)  # outputs
         X = f.get("x", None)
         U = f.get("u", None)  # inputs
@@ -58,37 +53,24 @@ def _read_file(file_path):
         id_ = f.get("exp_id", None)  # experiment run id
         Time = f.get("Time", None)
     elif file_type == "csv":
-        data = pd.read_csv(file_path)
-        Y = _extract_var(data, "^y[0-9]+$")
-        X = _extract_var(data, "^x[0-9]+$")
-        U = _extract_var(data, "^u[0-9]+$")
-        D = _extract_var(data, "^d[0-9]+$")
-        id_ = _extract_var(data, "^exp_id")
-        Time = _extract_var(data, "^Time$")
+        data = pd.read_csv(file_path, usecols=lambda c: _CSV_COLUMNS.search(c) is not None)
+        variables = _extract_vars(data)
+        Y, X, U, D, id_, Time = (variables.get(k) for k in ["Y", "X", "U", "D", "exp_id", "Time"])
     else:
         print(f"error: unsupported file type: {file_type}")
 
     assert any([v is not None for v in [Y, X, U, D]])
 
-    if id_ is None and Time is None:
-        return {
-            k: v for k, v in zip(["Y", "X", "U", "D"], [Y, X, U, D]) if v is not None
-        }
-    elif Time is None:
-        return [
-            {k: v[id_.flatten() == i, ...] for k, v in zip(["Y", "X", "U", "D"], [Y, X, U, D]) if v is not None}
-            for i in sorted(set(id_.flatten()))
-        ]
-    elif id_ is None:
-        return {
-            k: v for k, v in zip(["Time", "Y", "X", "U", "D"], [Time, Y, X, U, D]) if v is not None
-        }
-    else:
-        return [
-            {k: v[id_.flatten() == i, ...] for k, v in zip(["Time", "Y", "X", "U", "D"], [Time, Y, X, U, D]) if
-             v is not None}
-            for i in sorted(set(id_.flatten()))
-        ]
+    data = {k: v for k, v in zip(["Time", "Y", "X", "U", "D"], [Time, Y, X, U, D]) if v is not None}
+    return data if id_ is None else _split_experiments(data, id_)
+
+
+@functools.lru_cache(maxsize=2)
+def _cached_read_file(path, mtime):
+    """Memoize recently parsed data files across FileEmulator instances; mtime invalidates stale entries.
+    Callers must not modify the cached arrays, see FileEmulator.retrieve_data.
+    """
+    return read_file(path)
 
 
 class FileEmulator(EmulatorBase):
@@ -134,10 +116,14 @@ class FileEmulator(EmulatorBase):
 
     def retrieve_data(self):
         if hasattr(self, '_path'):
-            return read_file(self._path)
+            path = self._path
         else:
-            download(self.url, self.path)
-            return read_file(self.path)
+            path = self.path
+            download(self.url, path)
+        data = _cached_read_file(path, os.path.getmtime(path))
+        # copy the arrays so in-place edits by an instance cannot leak into the cache or other instances
+        copy = lambda d: {k: v.copy() for k, v in d.items()}
+        return [copy(d) for d in data] if isinstance(data, list) else copy(data)
 
     @property
     def path(self):
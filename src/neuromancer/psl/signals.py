@@ -187,14 +187,10 @@ def prbs(nsim, d, min=0., max=1., p=.9, rng=np.random.default_rng()):
     :return: (np.array shape=(nsim, d)) PRBS time series
     """
     min, max = _vectorize_and_check([min, max], d)
-    signal = min.reshape(1, d)
-    other = max.reshape(d)
-    for i in range(nsim-1):
-        switch = rng.uniform(size=d) > p
-        s = [other[dim] if switch[dim] else signal[i, dim] for dim in range(d)]
-        other = [signal[i, dim] if switch[dim] else other[dim] for dim in range(d)]
-        signal = np.concatenate([signal, np.array(s).reshape(1, d)], axis=0)
-    return signal[:nsim]
+    # all switching draws at once; a dimension sits at max after an odd number of switches
+    switches = rng.uniform(size=(nsim - 1 if nsim > 0 else 0, d)) > p
+    parity = np.concatenate([np.zeros((1, d), dtype=int), np.cumsum(switches, axis=0) % 2])
+    return np.where(parity == 1, max.reshape(1, d), min.reshape(1, d))[:nsim]
 
 def beta(nsim, d, min=0., max=1., alpha: float=2, beta: float=2, rng=np.random.default_rng()):
     ''' 
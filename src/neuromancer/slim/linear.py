@@ -202,7 +202,7 @@ class ButterflyLinear(LinearBase):
                                 ortho_init=ortho_init)
 
     def effective_W(self):
-        return self.linmap(torch.eye(self.in_features).to(self.linmap.twiddle.device))
+        return self.linmap(torch.eye(self.in_features, device=self.linmap.twiddle.device))
 
     def forward(self, x):
         return self.linmap(x)
@@ -519,9 +519,9 @@ class SVDLinear(LinearBase):
 
     def orthogonal_error(self, weight):
         size = weight.shape[0]
-        return torch.norm(torch.norm(torch.eye(size).to(weight.device) -
+        return torch.norm(torch.norm(torch.eye(size, device=weight.device) -
                               torch.mm(weight, torch.t(weight)), 2) +
-                           torch.norm(torch.eye(size).to(weight.device) -
+                           torch.norm(torch.eye(size, device=weight.device) -
                                       torch.mm(torch.t(weight), weight), 2), 2)
 
     def reg_error(self):
@@ -536,7 +536,7 @@ class SVDLinear(LinearBase):
         :return: Matrix for linear transformation with dominant eigenvalue between sigma_max and sigma_min
         """
         sigma_clapmed = self.sigma_max - (self.sigma_max - self.sigma_min) * torch.sigmoid(self.sigma)
-        Sigma_bounded = torch.eye(self.in_features, self.out_features).to(self.sigma.device) * sigma_clapmed
+        Sigma_bounded = torch.eye(self.in_features, self.out_features, device=self.sigma.device) * sigma_clapmed
         w_svd = torch.mm(self.U, torch.mm(Sigma_bounded, self.V))
         return w_svd
 
@@ -587,7 +587,7 @@ class OrthogonalLinear(SquareLinear):
         self.U = nn.Parameter(torch.triu(torch.randn(insize, insize)))
 
     def effective_W(self):
-        return self.forward(torch.eye(self.in_features).to(self.U.device))
+        return self.forward(torch.eye(self.in_features, device=self.U.device))
 
     def forward(self, x):
         for i in range(0, self.in_features):
@@ -676,7 +676,7 @@ class SpectralLinear(LinearBase):
         return x
 
     def effective_W(self):
-        return self.forward(torch.eye(self.in_features).to(self.p.device))
+        return self.forward(torch.eye(self.in_features, device=self.p.device))
 
     def forward(self, x):
         x = self.Umultiply(x)
@@ -790,7 +790,7 @@ class TrivialNullSpaceLinear(LinearBase):
         self.outsize = outsize
 
     def effective_W(self):
-        W_upper = torch.matmul(self.Gl1.T, self.Gl1) + self.epsilon*torch.eye(self.insize)
+        W_upper = torch.matmul(self.Gl1.T, self.Gl1) + self.epsilon*torch.eye(self.insize, device=self.Gl1.device)
         return torch.cat([W_upper, self.Gl2]).T
 
 
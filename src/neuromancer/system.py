@@ -18,6 +18,7 @@ import pydot
 import matplotlib.image as mpimg
 import matplotlib.pyplot as plt
 import torch
+from torch.utils.checkpoint import checkpoint
 import torch.nn as nn
 
 from neuromancer.constraint import Variable
@@ -116,7 +117,7 @@ class System(nn.Module):
     """
     Simple implementation for arbitrary cyclic computation
     """
-    def __init__(self, nodes, name=None, nstep_key='X', init_func=None, nsteps=None):
+    def __init__(self, nodes, name=None, nstep_key='X', init_func=None, nsteps=None, checkpoint_steps=None):
         """
 
         :param nodes: (list of Node objects)
@@ -124,10 +125,15 @@ class System(nn.Module):
         :param nstep_key: (str) Key is used to infer number of rollout steps from input_data
         :param init_func: (callable(input_dict) -> input_dict) This function is used to set initial conditions of the system
         :param nsteps: (int) prediction horizon (rollout steps) length
+        :param checkpoint_steps: (int) If given, the rollout is split into segments of this many steps whose
+                                 intermediate activations are recomputed during backward (activation checkpointing)
+                                 instead of stored, trading an extra forward pass for memory on long horizons.
+                                 A segment length around sqrt(nsteps) balances stored and recomputed activations.
         """
         super().__init__()
         self.nstep_key = nstep_key
         self.nsteps = nsteps
+        self.checkpoint_steps = checkpoint_steps
         self.nodes, self.name = nn.ModuleList(nodes), name
         if init_func is not None:
             self.init = init_func
@@ -269,13 +275,78 @@ class System(nn.Module):
         data = input_dict.copy()
         nsteps = self.nsteps if self.nsteps is not None else data[self.nstep_key].shape[1]  # Infer number of rollout steps
         data = self.init(data)  # Set initial conditions of the system
-        for i in range(nsteps):
-            for node in self.nodes:
-                indata = {k: data[k][:, i] for k in node.input_keys}  # collect what the compute node needs from data nodes
-                outdata = node(indata)  # compute
-                data = self.cat(data, outdata)  # feed the data nodes
+        # node outputs are kept as per-step lists and stacked once after the rollout,
+        # instead of re-concatenating the growing trajectories at every step;
+        # subclasses overriding cat keep feeding the data nodes through it at every step
+        stack_once = type(self).cat is System.cat
+        step, state = (self._append_step, {}) if stack_once else (self._cat_step, data)
+        segment = self.checkpoint_steps if self.checkpoint_steps is not None else max(nsteps, 1)
+        for start in range(0, nsteps, segment):
+            end = min(start + segment, nsteps)
+            if self.checkpoint_steps is not None and torch.is_grad_enabled():
+                state = self._checkpoint_segment(step, data, state, start, end)
+            else:
+                for i in range(start, end):
+                    state = step(data, state, i)
+        if not stack_once:
+            return state  # return recorded system measurements
+        data.update({k: torch.stack(v, dim=1) for k, v in state.items()})
         return data  # return recorded system measurements
 
+    def _append_step(self, data, steps, i):
+        """
+        One rollout step appending node outputs to the per-step lists in steps
+        :param data: (dict: {str: Tensor}) Input data of the rollout, read for keys not produced by nodes
+        :param steps: (dict: {str: list of Tensor}) Per-step node outputs, seeded with data when a key is present there
+        :param i: (int) Rollout step
+        :return: (dict: {str: list of Tensor})
+        """
+        for node in self.nodes:
+            # collect what the compute node needs from data nodes
+            indata = {k: steps[k][i] if k in steps else data[k][:, i] for k in node.input_keys}
+            outdata = node(indata)  # compute
+            for k, v in outdata.items():  # feed the data nodes
+                if k not in steps:
+                    steps[k] = list(data[k].unbind(1)) if k in data else []
+                steps[k].append(v)
+        return steps
+
+    def _cat_step(self, data, state, i):
+        """
+        One rollout step feeding node outputs through cat, for subclasses overriding it
+        :param data: (dict: {str: Tensor}) Input data of the rollout, unused as state carries it
+        :param state: (dict: {str: Tensor}) Data with the trajectories recorded so far
+        :param i: (int) Rollout step
+        :return: (dict: {str: Tensor})
+        """
+        for node in self.nodes:
+            indata = {k: state[k][:, i] for k in node.input_keys}
+            state = self.cat(state, node(indata))  # feed the data nodes
+        return state
+
+    def _checkpoint_segment(self, step, data, state, start, end):
+        """
+        Runs rollout steps start to end under activation checkpointing
+        :param step: (callable) _append_step or _cat_step
+        :param data: (dict: {str: Tensor}) Input data of the rollout
+        :param state: (dict) Rollout state before the segment
+        :param start: (int) First step of the segment
+        :param end: (int) Step after the last step of the segment
+        :return: (dict) Rollout state after the segment
+        """
+        # the recomputation in backward must see the data and state as they were before the segment,
+        # so the segment works on copies and never on the lists and dicts the rollout keeps updating
+        copy = lambda s: {k: list(v) if isinstance(v, list) else v for k, v in s.items()}
+        data, snapshot = dict(data), copy(state)
+
+        def segment():
+            local = copy(snapshot)
+            for i in range(start, end):
+                local = step(data, local, i)
+            return local
+
+        return checkpoint(segment, use_reentrant=False)
+
     def freeze(self):
         """
         Freezes the parameters of all nodes in the system
@@ -20,7 +20,10 @@ from lightning.pytorch.callbacks.early_stopping import EarlyStopping
 
 
 def move_batch_to_device(batch, device="cpu"):
-    return {k: v.to(device) if isinstance(v, torch.Tensor) else v for k, v in batch.items()}
+    # host-to-GPU copies are issued asynchronously (overlapping when the DataLoader pins memory);
+    # copies back to the host stay blocking so results are safe to read immediately
+    non_blocking = torch.device(device).type == "cuda"
+    return {k: v.to(device, non_blocking=non_blocking) if isinstance(v, torch.Tensor) else v for k, v in batch.items()}
 
 
 class CustomEarlyStopping(EarlyStopping):
@@ -47,7 +50,8 @@ class CustomEarlyStopping(EarlyStopping):
 class LitTrainer(pl.Trainer):
     def __init__(self, epochs=1000, train_metric='train_loss', dev_metric='dev_loss', test_metric='test_loss', eval_metric='dev_loss',
                  patience=None, warmup=0, clip=100.0, custom_optimizer=None, save_weights=True, weight_path='./', weight_name=None, devices='auto', strategy='auto', 
-                 accelerator='auto', profiler=None, custom_training_step=None, custom_hooks=None, logger=None, hparam_config=None, automatic_optimization=True):
+                 accelerator='auto', profiler=None, custom_training_step=None, custom_hooks=None, logger=None, hparam_config=None, automatic_optimization=True,
+                 precision='32-true'):
 
         """
         A Neuromancer-specific custom trainer class inheriting from PyTorch Lightning's Trainer. 
@@ -74,6 +78,7 @@ class LitTrainer(pl.Trainer):
         :param logger: A PyTorch Lightning logger e.g. TensorboardLogger(). Defaults to None. 
         :param hparam_config: A wandb hyperparameter configuration file. Only used for hyperparameter tuning. 
         :param automatic_optimization: If custom_training_step is defined, then this flag set to True means lightning expects custom_training_step to handle the gradients rather than return a loss
+        :param precision: Lightning training precision. Defaults to '32-true'. Use e.g. 'bf16-mixed' to run forward passes under bf16 autocast on supporting hardware.
         """
 
         self.epochs = epochs
@@ -110,10 +115,10 @@ class LitTrainer(pl.Trainer):
         # when using automatic optimization in lightning automatic gradient clipping is not supported
         if (self.automatic_optimization is False) and (self.custom_training_step is not None):
             super().__init__(max_epochs=self.epochs, callbacks=callbacks, devices=self.devices, strategy=strategy, accelerator=accelerator, \
-                            profiler=self.profiler, logger=self.logger)
+                            profiler=self.profiler, logger=self.logger, precision=precision)
         else:
             super().__init__(max_epochs=self.epochs, callbacks=callbacks, devices=self.devices, strategy=strategy, accelerator=accelerator, \
-                            gradient_clip_val=clip, profiler=self.profiler, logger=self.logger)
+                            gradient_clip_val=clip, profiler=self.profiler, logger=self.logger, precision=precision)
 
     def apply_custom_hooks(self, model):
         """
@@ -178,7 +183,8 @@ class Trainer:
         eval_mode="min",
         clip=100.0,
         multi_fidelity=False,
-        device="cpu"
+        device="cpu",
+        autocast_dtype=None,
     ):
         """
 
@@ -192,9 +198,15 @@ class Trainer:
         :param warmup: (int) How many epochs to wait before enacting early stopping policy
         :param eval_metric: (str) Performance metric for model selection and early stopping
         :param multi_fidelity: (bool) If yes, performs updates on the parameter alpha of the multi-fidelity net
+        :param autocast_dtype: (torch.dtype) If given (e.g. torch.bfloat16), training and validation forward passes
+            run under torch.autocast with this dtype; parameters and optimizer state stay in float32
         """
         self.model = problem
-        self.optimizer = optimizer if optimizer is not None else torch.optim.Adam(problem.parameters(), 0.01, betas=(0.0, 0.9))
+        if optimizer is None:
+            # the fused kernel updates all parameters in one launch; used when the model already lives on CUDA
+            fused = True if all(p.is_cuda for p in problem.parameters()) else None
+            optimizer = torch.optim.Adam(problem.parameters(), 0.01, betas=(0.0, 0.9), fused=fused)
+        self.optimizer = optimizer
         self.train_data = train_data
         self.dev_data = dev_data
         self.test_data = test_data
@@ -223,6 +235,11 @@ class Trainer:
         self.best_model = deepcopy(self.model.state_dict())
         self.multi_fidelity=multi_fidelity
         self.device = device
+        self.autocast_dtype = autocast_dtype
+
+    def _autocast(self):
+        return torch.autocast(device_type=torch.device(self.device).type, dtype=self.autocast_dtype,
+                              enabled=self.autocast_dtype is not None)
 
     def train(self):
         """
@@ -239,7 +256,8 @@ class Trainer:
                 for t_batch in self.train_data:
                     t_batch['epoch'] = i
                     t_batch = move_batch_to_device(t_batch, self.device)
-                    output = self.model(t_batch)
+                    with self._autocast():
+                        output = self.model(t_batch)
 
                     if self.multi_fidelity:
                         for node in self.model.nodes:
@@ -265,7 +283,8 @@ class Trainer:
                         losses = []
                         for d_batch in self.dev_data:
                             d_batch = move_batch_to_device(d_batch, self.device)
-                            eval_output = self.model(d_batch)
+                            with self._autocast():
+                                eval_output = self.model(d_batch)
                             losses.append(eval_output[self.dev_metric])
                         eval_output[f'mean_{self.dev_metric}'] = torch.mean(torch.stack(losses))
                         output = {**output, **eval_output}
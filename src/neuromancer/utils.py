@@ -1,6 +1,8 @@
 
+import re
 import torch
 import functools
+import numpy as np
 from collections import OrderedDict
 
 def handle_device_placement(func):
@@ -32,4 +34,37 @@ def load_state_dict_lightning(problem, weight_path):
     weights = torch.load(weight_path)['state_dict']
     weights = OrderedDict({key.replace('problem.', '', 1): value for key, value in weights.items()})
     problem.load_state_dict(weights)
-    return problem
\ No newline at end of file
+    return problem
+
+
+# one named group per variable extracted by the data file readers in neuromancer.dataset and
+# neuromancer.psl.file_emulator; also used so pandas only parses these columns
+_CSV_COLUMNS = re.compile(
+    r"^(?:(?P<Y>y[0-9]+$)|(?P<X>x[0-9]+$)|(?P<U>u[0-9]+$)|(?P<D>d[0-9]+$)|(?P<exp_id>exp_id)|(?P<Time>Time$))"
+)
+
+
+def _extract_vars(data):
+    """Group CSV columns into variable arrays with a single scan of the column names."""
+    columns = {}
+    for c in data.columns:
+        match = _CSV_COLUMNS.search(c)
+        if match is not None:
+            columns.setdefault(match.lastgroup, []).append(c)
+    return {k: data[v].values for k, v in columns.items()}
+
+
+def _split_experiments(data, id_):
+    """Split a data dictionary into a list of dictionaries, one per experiment id (in sorted id order).
+
+    A single stable sort groups the rows of every experiment, so each variable is gathered once
+    rather than masked once per experiment.
+
+    :param data: (dict str: np.array) data dictionary with rows aligned to id_.
+    :param id_: (np.array) experiment run id of each row.
+    """
+    ids = id_.flatten()
+    order = np.argsort(ids, kind="stable")
+    bounds = np.flatnonzero(np.diff(ids[order])) + 1
+    groups = {k: np.split(v[order], bounds) for k, v in data.items()}
+    return [{k: v[i] for k, v in groups.items()} for i in range(len(bounds) + 1)]
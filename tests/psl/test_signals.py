@@ -32,3 +32,12 @@ def test_signal_bound(signal, nsim, d, bound):
     assert out.max() <= bound[1]
     assert out.min() >= bound[0]
 
+
+
+@pytest.mark.parametrize("nsim", [0, 1])
+def test_prbs_short_horizons(nsim):
+    """
+    prbs should return an (nsim, d) array for horizons too short to switch
+    """
+    out = sig["prbs"](nsim, 2, rng=np.random.default_rng(SEED))
+    assert out.shape == (nsim, 2)
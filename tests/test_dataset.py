@@ -0,0 +1,161 @@
+import numpy as np
+import torch
+import pytest
+
+from torch.utils.data import DataLoader
+
+from neuromancer.dataset import SequenceDataset, DictDataset, StaticDataset, FullBatchLoader, BatchSliceLoader, unbatch_tensor, \
+    normalize_data, norm_fns, _split_experiments, get_static_dataloaders
+
+torch.manual_seed(0)
+np.random.seed(0)
+
+
+def make_data(nsim=50, ny=3, nu=2):
+    return {'Y': np.random.randn(nsim, ny), 'U': np.random.randn(nsim, nu)}
+
+
+@pytest.mark.parametrize("moving_horizon", [False, True])
+def test_single_sequence_batches_are_views(moving_horizon):
+    ds = SequenceDataset(make_data(), nsteps=5, moving_horizon=moving_horizon)
+    assert ds.batched_data.untyped_storage().data_ptr() == ds.full_data.untyped_storage().data_ptr()
+
+
+@pytest.mark.parametrize("moving_horizon", [False, True])
+def test_single_sequence_matches_multisequence(moving_horizon):
+    data = make_data()
+    single = SequenceDataset(data, nsteps=5, moving_horizon=moving_horizon)
+    multi = SequenceDataset([data], nsteps=5, moving_horizon=moving_horizon)
+    assert len(single) == len(multi)
+    for k, v in single.get_full_batch().items():
+        if k != 'name':
+            assert torch.equal(v, multi.get_full_batch()[k])
+
+
+@pytest.mark.parametrize("multisequence", [False, True])
+def test_to_device_rederives_views(multisequence):
+    data = make_data()
+    ds = SequenceDataset([data, data] if multisequence else data, nsteps=5)
+    expected = ds.get_full_batch()
+    ds.to(torch.device('cpu'))
+    for k, v in ds.get_full_batch().items():
+        if k != 'name':
+            assert torch.equal(v, expected[k])
+    if not multisequence:
+        assert ds.batched_data.untyped_storage().data_ptr() == ds.full_data.untyped_storage().data_ptr()
+
+
+@pytest.mark.parametrize("shape", [(6, 4), (6, 3, 4), (6, 2, 3, 4)])
+def test_unbatch_tensor_matches_concatenation(shape):
+    x = torch.randn(*shape)
+    assert torch.equal(unbatch_tensor(x), torch.cat(torch.unbind(x, 0), dim=-1))
+
+
+def test_split_experiments_matches_masking():
+    ids = np.random.choice([3, 1, 2, 7], (40, 1)).astype(float)
+    data = make_data(nsim=40)
+    expected = [{k: v[ids.flatten() == i] for k, v in data.items()} for i in sorted(set(ids.flatten()))]
+    result = _split_experiments(data, ids)
+    assert len(result) == len(expected)
+    for r, e in zip(result, expected):
+        for k in e:
+            assert np.array_equal(r[k], e[k])
+
+
+def test_full_batch_loader_matches_dataloader():
+    ds = SequenceDataset([make_data(), make_data(nsim=30)], nsteps=4)
+    expected = next(iter(DataLoader(ds, batch_size=len(ds), shuffle=False, collate_fn=ds.collate_fn)))
+    loader = FullBatchLoader(ds)
+    assert len(loader) == 1
+    for _ in range(2):
+        batches = list(loader)
+        assert len(batches) == 1 and batches[0].keys() == expected.keys()
+        for k, v in expected.items():
+            assert torch.equal(batches[0][k], v) if isinstance(v, torch.Tensor) else batches[0][k] == v
+        batches[0]['epoch'] = 0
+
+
+def test_full_batch_loader_follows_dataset_device():
+    ds = SequenceDataset(make_data(), nsteps=4)
+    loader = FullBatchLoader(ds)
+    assert next(iter(loader))['Yp'].device.type == 'cpu'
+    ds.to('meta')
+    assert next(iter(loader))['Yp'].device.type == 'meta'
+    assert next(iter(FullBatchLoader(SequenceDataset(make_data(), nsteps=4), device='meta')))['Yp'].is_meta
+
+
+@pytest.mark.skipif(torch.cuda.is_available(), reason="pinning is only skipped without CUDA")
+def test_full_batch_loader_warns_when_pinning_is_unavailable():
+    with pytest.warns(UserWarning, match="pin_memory"):
+        loader = FullBatchLoader(SequenceDataset(make_data(), nsteps=4), pin_memory=True)
+    assert not next(iter(loader))['Yp'].is_pinned()
+
+
+@pytest.mark.parametrize("shuffle", [False, True])
+def test_batch_slice_loader_covers_dataset(shuffle):
+    data = {'a': torch.arange(10.).reshape(10, 1), 'p': torch.arange(10.).reshape(10, 1) * 2}
+    ds = DictDataset(data, name='train')
+    loader = BatchSliceLoader(ds, batch_size=4, shuffle=shuffle)
+    batches = list(loader)
+    assert len(loader) == len(batches) == 3
+    assert [b['a'].shape[0] for b in batches] == [4, 4, 2]
+    assert all(b['name'] == 'train' and torch.equal(b['p'], 2 * b['a']) for b in batches)
+    a = torch.cat([b['a'] for b in batches])
+    assert torch.equal(a.sort(dim=0).values, data['a'])
+    if not shuffle:
+        expected = list(DataLoader(ds, batch_size=4, collate_fn=ds.collate_fn))
+        assert all(torch.equal(b['a'], e['a']) for b, e in zip(batches, expected))
+
+
+def test_batch_slice_loader_matches_dataloader_for_static_data():
+    ds = StaticDataset({'a': np.random.randn(10, 2), 'p': np.random.randn(10, 1)}, name='dev')
+    expected = list(DataLoader(ds, batch_size=4, collate_fn=ds.collate_fn))
+    batches = list(BatchSliceLoader(ds, batch_size=4))
+    assert len(batches) == len(expected)
+    for b, e in zip(batches, expected):
+        assert b.keys() == e.keys()
+        for k, v in e.items():
+            assert torch.equal(b[k], v) if isinstance(v, torch.Tensor) else b[k] == v
+
+
+@pytest.mark.parametrize("slice_batches, loader_type", [(False, DataLoader), (True, BatchSliceLoader)])
+def test_static_dataloaders_slice_batches_opt_in(slice_batches, loader_type):
+    loaders, _ = get_static_dataloaders({'a': np.random.randn(30, 2)}, batch_size=4, slice_batches=slice_batches)
+    assert all(isinstance(loader, loader_type) for loader in loaders)
+
+
+@pytest.mark.parametrize("norm_type", ["zscore", "zero-one", "one-one"])
+def test_normalize_data_matches_per_variable_normalization(norm_type):
+    data = [{'Y': np.random.randn(20, 3), 'U': np.random.randn(20, 1)},
+            {'Y': np.random.randn(30, 3), 'U': np.random.randn(30, 1)}]
+    norm_data, stats = normalize_data(data, norm_type)
+    for k in ['Y', 'U']:
+        expected, stat0, stat1 = norm_fns[norm_type](np.concatenate([d[k] for d in data]))
+        assert np.allclose(np.concatenate([d[k] for d in norm_data]), expected)
+        assert np.allclose(stats[k + '_min'], stat0) and np.allclose(stats[k + '_max'], stat1)
+    renormed, _ = normalize_data(data, norm_type, stats)
+    assert all(np.allclose(a[k], b[k]) for a, b in zip(renormed, norm_data) for k in a)
+
+
+@pytest.mark.parametrize("norm_type", ["zscore", "zero-one", "one-one"])
+@pytest.mark.parametrize("dtype, expected", [(np.uint8, np.float64), (np.int16, np.float64),
+                                             (np.float32, np.float32), (np.float64, np.float64)])
+def test_norm_fns_output_dtype(norm_type, dtype, expected):
+    M = np.arange(12).reshape(6, 2).astype(dtype)
+    M_norm, _, _ = norm_fns[norm_type](M)
+    assert M_norm.dtype == expected
+
+
+def test_normalize_data_preserves_variable_dtypes():
+    data = {'Y': np.random.randn(20, 3).astype(np.float32), 'U': np.random.randn(20, 1)}
+    norm_data, stats = normalize_data(data, "zscore")
+    assert norm_data['Y'].dtype == np.float32 and norm_data['U'].dtype == np.float64
+    assert stats['Y_min'].dtype == np.float32
+
+
+@pytest.mark.parametrize("norm_type", ["zscore", "zero-one", "one-one"])
+def test_normalize_data_accepts_single_tensor_sequence(norm_type):
+    data = {'Y': torch.randn(50, 2), 'U': torch.randn(50, 1)}
+    norm_data, stats = normalize_data(data, norm_type)
+    expected, _ = normalize_data({k: v.numpy() for k, v in data.items()}, norm_type)
+    assert all(isinstance(v, np.ndarray) and np.allclose(v, expected[k]) for k, v in norm_data.items())
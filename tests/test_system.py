@@ -475,6 +475,47 @@ def test_system_cat():
     assert dict_equals(test_cat_result, expected_cat_result)
 
 
+def test_forward_uses_overridden_cat():
+    """ Test that System subclasses overriding cat still feed the data nodes through it """
+    class CountingSystem(System):
+        ncalls = 0
+
+        def cat(self, data3d, data2d):
+            CountingSystem.ncalls += 1
+            return super().cat(data3d, data2d)
+
+    node_1 = Node(lambda x: x*2, ['x1'], ['x1'])
+    input_data_dict = {'x1': torch.rand(2, 1, 1)}
+    result = CountingSystem(nodes=[node_1], nsteps=3)(input_data_dict)
+    expected = System(nodes=[node_1], nsteps=3)(input_data_dict)
+    assert CountingSystem.ncalls == 3
+    assert dict_equals(result, expected)
+
+
+class CatSystem(System):
+    def cat(self, data3d, data2d):
+        return super().cat(data3d, data2d)
+
+
+@pytest.mark.parametrize("system_cls", [System, CatSystem])
+@pytest.mark.parametrize("checkpoint_steps", [1, 3, 10])
+def test_checkpointed_rollout_matches_rollout(system_cls, checkpoint_steps):
+    """ Test that activation checkpointing of the rollout leaves outputs and gradients unchanged """
+    torch.manual_seed(0)
+    f, policy = nn.Linear(3, 2), nn.Linear(2, 1)
+    nodes = [Node(policy, ['x'], ['u']), Node(lambda x, u, d: torch.tanh(f(torch.cat([x, u], -1))) + d,
+                                               ['x', 'u', 'd'], ['x'])]
+    data = {'x': torch.randn(4, 1, 2), 'd': torch.randn(4, 7, 2)}
+    results, grads = [], []
+    for steps in [None, checkpoint_steps]:
+        out = system_cls(nodes, nsteps=7, checkpoint_steps=steps)(data)
+        results.append(out)
+        grads.append(torch.autograd.grad(out['x'].square().sum() + out['u'].sum(), list(f.parameters()) + list(policy.parameters())))
+    assert results[0].keys() == results[1].keys()
+    assert all(torch.allclose(results[0][k], results[1][k]) for k in results[0])
+    assert all(torch.allclose(a, b) for a, b in zip(*grads))
+
+
 def test_forward_on_valid_node_lists(get_nodes_and_edges, get_nstep_batch):
     """
     Function to test System's forward on a variety of graph types,
@@ -263,6 +263,20 @@ def test_weight_updates(get_problem, get_data):
     compare_state_dicts(base_trainer_initial_weights, base_trainer_final_weights)
     compare_state_dicts(lit_trainer_initial_weights, lit_trainer_final_weights)
 
+def test_bf16_autocast_keeps_fp32_weights(get_data):
+    problem = sample_problem()
+    train_data, dev_data, _, batch_size = get_data(nsim=256)
+    train_loader = torch.utils.data.DataLoader(train_data, batch_size=batch_size,
+                                               collate_fn=train_data.collate_fn, shuffle=True)
+    dev_loader = torch.utils.data.DataLoader(dev_data, batch_size=batch_size,
+                                             collate_fn=dev_data.collate_fn)
+    trainer = Trainer(problem, train_loader, dev_loader, patience=99999, epochs=2,
+                      autocast_dtype=torch.bfloat16)
+    best_model = trainer.train()
+    assert trainer.current_epoch == 2
+    assert all(v.dtype == torch.float32 for v in best_model.values() if v.is_floating_point())
+
+
 """
 def test_early_stopping(get_problem, get_data): 
     problem = get_problem